@@ -0,0 +1,187 @@
+import argparse
+import csv
+import glob
+import io
+import os
+import shutil
+import sys
+from itertools import zip_longest
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, '..', 'Web App'))
+
+from text_normalize import normalize_series
+
+DEFAULT_SOURCES = os.path.join(BASE_DIR, '..', 'Research', 'video_details*.csv')
+DEFAULT_DATASET = os.path.join(BASE_DIR, 'dataset')
+
+# Same category merges as pre_proc.ipynb; unlisted categories keep their name
+CATEGORY_MAPPING = {
+    'Sports': 'Sports',
+    'Howto & Style': 'Howto & Style',
+    'Autos & Vehicles': 'Autos & Vehicles',
+    'Travel & Events': 'Travel & Adventures',
+    'Science & Technology': 'Science & Learning',
+    'Education': 'Science & Learning',
+    'Music': 'Entertainment & Media',
+    'Comedy': 'Entertainment & Media',
+    'Entertainment': 'Entertainment & Media',
+    'Film & Animation': 'Entertainment & Media',
+    'Gaming': 'Entertainment & Media',
+    'People & Blogs': 'Lifestyle & Pets',
+    'Pets & Animals': 'Lifestyle & Pets',
+    'News & Politics': 'News & Politics'
+}
+
+# Dropped from training in pre_proc.ipynb; still stored, in its own partition
+EXCLUDED_CATEGORIES = ['Nonprofits & Activism']
+
+SCHEMA = pa.schema([
+    ('video_id', pa.string()),
+    ('url', pa.string()),
+    ('title', pa.string()),
+    ('description', pa.string()),
+    ('category', pa.string()),
+    ('clean_title', pa.string()),
+    ('clean_description', pa.string()),
+    ('new_category', pa.string()),
+    ('source_file', pa.string())
+])
+
+
+def video_key(url):
+    """Identify a video by its id so watch/short/youtu.be forms dedupe together"""
+    parsed = urlparse(url.strip())
+    if parsed.netloc.endswith('youtu.be'):
+        return parsed.path.lstrip('/').split('/')[0]
+    video_id = parse_qs(parsed.query).get('v')
+    if video_id:
+        return video_id[0]
+    if parsed.path.startswith(('/shorts/', '/embed/')):
+        return parsed.path.split('/')[2]
+    return url.strip()
+
+
+def read_source(path):
+    """Decode a harvester CSV as UTF-8, falling back to cp1252 and then latin-1"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    for encoding in ('utf-8-sig', 'cp1252', 'latin-1'):
+        try:
+            text = raw.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    # newline='' leaves record splitting to csv, so U+2028, \x85 etc. inside a title stay in it
+    return list(csv.DictReader(io.StringIO(text, newline=''))), encoding
+
+
+def build_dataset(sources, output, processes=None):
+    """Merge the source CSVs into one Parquet dataset partitioned by mapped category"""
+    rows = []
+    seen = set()
+    for path in sorted(glob.glob(sources)):
+        records, encoding = read_source(path)
+        added = 0
+        for record in records:
+            url = (record.get('URL') or '').strip()
+            title = record.get('Title')
+            if not url or not title:
+                continue
+            key = video_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            description = record.get('Description') or ''
+            category = (record.get('Category') or 'N/A').strip()
+            rows.append({
+                'video_id': key,
+                'url': url,
+                'title': title,
+                'description': description,
+                'category': category,
+                'new_category': CATEGORY_MAPPING.get(category, category),
+                'source_file': os.path.basename(path)
+            })
+            added += 1
+        print(f"{os.path.basename(path)}: {len(records)} rows ({encoding}), {added} new")
+
+    if not rows:
+        raise ValueError(f"No rows found in {sources}")
+
+    df = pd.DataFrame(rows)
+    # The same normalization the web app applies before classifying
+    df['clean_title'] = normalize_series(df['title'], processes=processes)
+    df['clean_description'] = normalize_series(df['description'], processes=processes)
+    table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+    # Rebuild from scratch so removed or re-categorized rows do not linger
+    tmp_output = f"{output}.tmp"
+    shutil.rmtree(tmp_output, ignore_errors=True)
+    pq.write_to_dataset(table, tmp_output, partition_cols=['new_category'])
+    shutil.rmtree(output, ignore_errors=True)
+    os.replace(tmp_output, output)
+    return table.num_rows
+
+
+def load_dataset(columns=None, path=DEFAULT_DATASET, categories=None,
+                 exclude=EXCLUDED_CATEGORIES, as_pandas=True):
+    """Read only the requested columns and category partitions, memory-mapped"""
+    filters = []
+    if categories:
+        filters.append(('new_category', 'in', list(categories)))
+    if exclude:
+        filters.append(('new_category', 'not in', list(exclude)))
+    table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+    if not as_pandas:
+        return table
+    df = table.to_pandas()
+    if 'new_category' in df:
+        # Partition values come back as a dictionary column
+        df['new_category'] = df['new_category'].astype(str)
+    return df
+
+
+def iter_batches(columns, path=DEFAULT_DATASET, batch_size=10000, categories=None,
+                 exclude=EXCLUDED_CATEGORIES):
+    """Stream pandas chunks that mix every category, holding one small batch per partition"""
+    dataset = ds.dataset(path, partitioning='hive')
+    expression = None
+    if categories:
+        expression = ds.field('new_category').isin(list(categories))
+    if exclude:
+        excluded = ~ds.field('new_category').isin(list(exclude))
+        expression = excluded if expression is None else expression & excluded
+    fragments = list(dataset.get_fragments(filter=expression))
+    sizes = [fragment.count_rows() for fragment in fragments]
+    total = sum(sizes) or 1
+    # Partitions are stored one category per directory; reading them in turn
+    # would hand partial_fit single-class chunks, so every chunk takes a
+    # slice of each partition proportional to its size
+    streams = [
+        ds.Scanner.from_fragment(fragment, schema=dataset.schema, columns=columns,
+                                 batch_size=max(1, -(-batch_size * size // total))).to_batches()
+        for fragment, size in zip(fragments, sizes)
+    ]
+    for batches in zip_longest(*streams):
+        batches = [batch for batch in batches if batch is not None and batch.num_rows]
+        if batches:
+            yield pa.Table.from_batches(batches).to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consolidate the harvested CSVs into a partitioned Parquet dataset")
+    parser.add_argument('--sources', default=DEFAULT_SOURCES, help="Glob of harvester CSVs (Title, Description, Category, URL)")
+    parser.add_argument('--output', default=DEFAULT_DATASET, help="Dataset directory to (re)create")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help="Worker processes for text normalization")
+    args = parser.parse_args()
+
+    total = build_dataset(args.sources, args.output, args.processes)
+    print(f"✅ Wrote {total:,} unique videos to {args.output}")
+    counts = load_dataset(['new_category'], args.output, exclude=None)['new_category'].value_counts()
+    print(counts.to_string())
@@ -0,0 +1,128 @@
+import argparse
+import os
+import time
+
+import joblib
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import GridSearchCV, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+from xgboost import XGBClassifier
+
+from build_dataset import DEFAULT_DATASET, EXCLUDED_CATEGORIES, load_dataset
+from feature_cache import DEFAULT_CACHE_DIR, tfidf_features
+from train import BASE_DIR, COLUMNS, TFIDF_PARAMS, full_text
+
+# Candidate models and their grids; the first value of each grid is the
+# notebook's setting. Models run single-threaded because the search
+# itself spreads (candidate, parameters, fold) fits over n_jobs workers.
+CANDIDATES = {
+    'logistic_regression': (
+        LogisticRegression(max_iter=1000, class_weight='balanced'),
+        {'C': [1.0, 0.3, 3.0]}
+    ),
+    'random_forest': (
+        RandomForestClassifier(n_estimators=200, class_weight='balanced', n_jobs=1),
+        {'max_features': ['sqrt', 'log2']}
+    ),
+    'xgboost_model': (
+        XGBClassifier(tree_method='hist', n_jobs=1),
+        {'max_depth': [6, 4]}
+    ),
+    'sgd_classifier': (
+        SGDClassifier(loss='log_loss', class_weight='balanced'),
+        {'alpha': [1e-5, 1e-4]}
+    )
+}
+
+
+def search(names, X_train, y_train, cv, n_jobs, seed):
+    """Cross-validate every candidate's grid in one pool and return the best parameters per model"""
+    grids = []
+    for name in names:
+        estimator, grid = CANDIDATES[name]
+        estimator = clone(estimator)
+        if 'random_state' in estimator.get_params():
+            estimator.set_params(random_state=seed)
+        grids.append({'model': [estimator], **{f'model__{key}': values for key, values in grid.items()}})
+    pipeline = Pipeline([('model', grids[0]['model'][0])])
+    grid_search = GridSearchCV(pipeline, grids, cv=cv, scoring='accuracy', n_jobs=n_jobs, refit=False, verbose=1)
+    grid_search.fit(X_train, y_train)
+
+    best = {}
+    results = grid_search.cv_results_
+    for i, params in enumerate(results['params']):
+        name = names[[grid['model'][0] for grid in grids].index(params['model'])]
+        score = results['mean_test_score'][i]
+        if name not in best or score > best[name]['cv_score']:
+            best[name] = {
+                'estimator': params['model'],
+                'params': {key[len('model__'):]: value for key, value in params.items() if key != 'model'},
+                'cv_score': score
+            }
+    return best
+
+
+def fit_and_score(name, estimator, params, X_train, y_train, X_test, y_test):
+    model = clone(estimator).set_params(**params)
+    started = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - started
+    y_pred = model.predict(X_test)
+    return name, model, y_pred, accuracy_score(y_test, y_pred), fit_seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare classifiers on cached TF-IDF features")
+    parser.add_argument('--dataset', default=DEFAULT_DATASET, help="Dataset written by build_dataset.py")
+    parser.add_argument('--models', nargs='+', choices=list(CANDIDATES), default=list(CANDIDATES))
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'output'), help="Directory for the .joblib artifacts")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Where fitted TF-IDF matrices are kept")
+    parser.add_argument('--jobs', type=int, default=-1, help="Parallel fits (-1: all cores)")
+    parser.add_argument('--cv', type=int, default=3, help="Cross-validation folds for the grid search")
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--include-all', dest='exclude', action='store_const', const=None,
+                        default=EXCLUDED_CATEGORIES, help="Also use categories pre_proc.ipynb dropped")
+    args = parser.parse_args()
+
+    df = load_dataset(COLUMNS, args.dataset, exclude=args.exclude)
+    le = LabelEncoder()
+    labels = le.fit_transform(df['new_category'])
+    # Same split as model_traning.ipynb
+    train_texts, test_texts, y_train, y_test = train_test_split(
+        full_text(df), labels, test_size=args.test_size, random_state=args.seed, stratify=labels
+    )
+
+    started = time.perf_counter()
+    tfidf, X_train, X_test, cached = tfidf_features(train_texts, test_texts, TFIDF_PARAMS, args.cache_dir)
+    print(f"{'Loaded cached' if cached else 'Fitted'} TF-IDF features {X_train.shape} in {time.perf_counter() - started:.1f}s")
+
+    best = search(args.models, X_train, y_train, args.cv, args.jobs, args.seed)
+    results = Parallel(n_jobs=min(args.jobs if args.jobs > 0 else os.cpu_count() or 1, len(best)))(
+        delayed(fit_and_score)(name, info['estimator'], info['params'], X_train, y_train, X_test, y_test)
+        for name, info in best.items()
+    )
+    results.sort(key=lambda result: result[3], reverse=True)
+
+    print(f"\n{'Model':<22}{'CV accuracy':>12}{'Test accuracy':>15}{'Fit (s)':>9}  Parameters")
+    for name, model, y_pred, accuracy, fit_seconds in results:
+        print(f"{name:<22}{best[name]['cv_score']:>12.4f}{accuracy:>15.4f}{fit_seconds:>9.1f}  {best[name]['params']}")
+
+    name, model, y_pred, accuracy, fit_seconds = results[0]
+    print(f"\nBest: {name}")
+    print(classification_report(y_test, y_pred, labels=np.arange(len(le.classes_)),
+                                target_names=le.classes_, zero_division=0))
+
+    os.makedirs(args.output, exist_ok=True)
+    joblib.dump(tfidf, os.path.join(args.output, 'tfidf_vectorizer.joblib'))
+    joblib.dump(le, os.path.join(args.output, 'label_encoder.joblib'))
+    for name, model, *_ in results:
+        joblib.dump(model, os.path.join(args.output, f"{name}.joblib"))
+    print(f"✅ Saved artifacts to {args.output}")
+    print(f"Publish one with: python '../Web App/model_registry.py' {args.output} --model-file {results[0][0]}.joblib")
@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+
+import joblib
+import scipy.sparse as sp
+import sklearn
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'feature_cache')
+
+
+def cache_key(train_texts, test_texts, params):
+    """Hash the vectorizer config and every train/test text, in order"""
+    digest = hashlib.sha1()
+    config = {'params': params, 'sklearn': sklearn.__version__}
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+    for name, texts in (('train', train_texts), ('test', test_texts)):
+        digest.update(f"{name}:{len(texts)};".encode('utf-8'))
+        for text in texts:
+            digest.update(text.encode('utf-8'))
+            digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def tfidf_features(train_texts, test_texts, params, cache_dir=DEFAULT_CACHE_DIR):
+    """Return (tfidf, X_train, X_test, cached), fitting the vectorizer only on a cache miss"""
+    train_texts = list(train_texts)
+    test_texts = list(test_texts)
+    path = os.path.join(cache_dir, cache_key(train_texts, test_texts, params))
+    if os.path.isdir(path):
+        return (joblib.load(os.path.join(path, 'tfidf_vectorizer.joblib')),
+                sp.load_npz(os.path.join(path, 'X_train.npz')),
+                sp.load_npz(os.path.join(path, 'X_test.npz')),
+                True)
+
+    tfidf = TfidfVectorizer(**params)
+    X_train = tfidf.fit_transform(train_texts)
+    X_test = tfidf.transform(test_texts)
+
+    # Write into a temp directory first so a half-written entry is never loaded
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(tmp_path, exist_ok=True)
+    # Uncompressed, since the point of the cache is a fast load
+    sp.save_npz(os.path.join(tmp_path, 'X_train.npz'), X_train, compressed=False)
+    sp.save_npz(os.path.join(tmp_path, 'X_test.npz'), X_test, compressed=False)
+    joblib.dump(tfidf, os.path.join(tmp_path, 'tfidf_vectorizer.joblib'))
+    with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+        json.dump({
+            'params': params,
+            'sklearn': sklearn.__version__,
+            'train_rows': X_train.shape[0],
+            'test_rows': X_test.shape[0],
+            'features': X_train.shape[1],
+            'created_at': datetime.now().isoformat(timespec='seconds')
+        }, f, indent=2, default=str)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        # Another run cached the same features first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return tfidf, X_train, X_test, False
@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from build_dataset import read_source
+
+HEADER = 'Title,Description,Category,URL\r\n'
+
+
+def write_csv(tmp_path, text, encoding='utf-8'):
+    path = tmp_path / 'video_details.csv'
+    path.write_bytes(text.encode(encoding))
+    return str(path)
+
+
+def test_read_source_keeps_unicode_line_breaks_inside_fields(tmp_path):
+    title = 'Part one\u2028part two\x85three\x0bfour\x0cfive\x1csix\x1dseven\x1eend'
+    path = write_csv(tmp_path, HEADER
+                     + f'"{title}","quoted description",Music,https://www.youtube.com/watch?v=a\r\n'
+                     + f'{title},plain,Sports,https://www.youtube.com/watch?v=b\r\n')
+    rows, encoding = read_source(path)
+    assert encoding == 'utf-8-sig'
+    assert [row['URL'] for row in rows] == ['https://www.youtube.com/watch?v=a', 'https://www.youtube.com/watch?v=b']
+    assert rows[0]['Title'] == title
+    assert rows[0]['Description'] == 'quoted description'
+    assert rows[1]['Title'] == title
+
+
+def test_read_source_keeps_newlines_in_quoted_fields(tmp_path):
+    path = write_csv(tmp_path, HEADER + '"Title","line one\r\nline two\nthree",Music,https://youtu.be/a\r\n')
+    rows, _ = read_source(path)
+    assert len(rows) == 1
+    assert rows[0]['Description'] == 'line one\r\nline two\nthree'
+
+
+def test_read_source_falls_back_to_cp1252(tmp_path):
+    path = write_csv(tmp_path, HEADER + 'Café – menu,desc,Music,https://youtu.be/a\r\n', encoding='cp1252')
+    rows, encoding = read_source(path)
+    assert encoding == 'cp1252'
+    assert rows[0]['Title'] == 'Café – menu'
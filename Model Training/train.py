@@ -0,0 +1,180 @@
+import argparse
+import os
+import sys
+import zlib
+from collections import Counter
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.preprocessing import LabelEncoder
+
+from build_dataset import DEFAULT_DATASET, EXCLUDED_CATEGORIES, iter_batches, load_dataset
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, '..', 'Web App'))
+
+from model_registry import publish, set_active
+
+# Vectorizer settings from model_traning.ipynb
+TFIDF_PARAMS = {
+    'max_features': 5000,
+    'ngram_range': (1, 2),
+    'min_df': 2,
+    'max_df': 0.95
+}
+COLUMNS = ['video_id', 'clean_title', 'clean_description', 'new_category']
+MODEL_FILE = 'sgd_classifier.joblib'
+
+
+def full_text(df):
+    return (df['clean_title'].fillna('') + ' ' + df['clean_description'].fillna('')).tolist()
+
+
+def is_test(video_ids, test_size):
+    """Stable hash split, so every pass and every run agrees on the held-out rows"""
+    cutoff = int(test_size * 1000)
+    return np.array([zlib.crc32(video_id.encode('utf-8')) % 1000 < cutoff for video_id in video_ids], dtype=bool)
+
+
+def iter_split(args, test=False):
+    for df in iter_batches(COLUMNS, args.dataset, args.chunk_size, exclude=args.exclude):
+        mask = is_test(df['video_id'], args.test_size)
+        df = df[mask if test else ~mask]
+        if len(df):
+            yield full_text(df), df['new_category'].astype(str).tolist()
+
+
+def select_vocabulary(doc_freq, term_freq, n_docs, min_df, max_df, max_features):
+    """Apply min_df/max_df/max_features the way TfidfVectorizer.fit does"""
+    max_doc_count = max_df if isinstance(max_df, int) else max_df * n_docs
+    min_doc_count = min_df if isinstance(min_df, int) else min_df * n_docs
+    terms = sorted(term for term, df in doc_freq.items() if min_doc_count <= df <= max_doc_count)
+    if max_features is not None and len(terms) > max_features:
+        # Same argsort over alphabetically sorted terms, so ties at the cut-off match too
+        counts = np.array([term_freq[term] for term in terms], dtype=np.int64)
+        terms = sorted(terms[i] for i in (-counts).argsort()[:max_features])
+    return terms
+
+
+def fit_vectorizer(args):
+    """Count document frequencies chunk by chunk and build a fitted TfidfVectorizer
+
+    Memory grows with the number of distinct n-grams, not with the corpus.
+    """
+    analyzer = TfidfVectorizer(**TFIDF_PARAMS).build_analyzer()
+    doc_freq = Counter()
+    term_freq = Counter()
+    class_counts = Counter()
+    n_docs = 0
+    for texts, labels in iter_split(args):
+        for text in texts:
+            terms = analyzer(text)
+            term_freq.update(terms)
+            doc_freq.update(set(terms))
+        class_counts.update(labels)
+        n_docs += len(texts)
+        print(f"\rCounted {n_docs:,} training documents, {len(doc_freq):,} distinct terms", end='', flush=True)
+    print()
+    if not n_docs:
+        raise ValueError(f"No training rows in {args.dataset}")
+
+    vocabulary = select_vocabulary(doc_freq, term_freq, n_docs, TFIDF_PARAMS['min_df'],
+                                   TFIDF_PARAMS['max_df'], TFIDF_PARAMS['max_features'])
+    tfidf = TfidfVectorizer(vocabulary=vocabulary, **TFIDF_PARAMS)
+    # smooth_idf=True: idf = ln((1 + n) / (1 + df)) + 1
+    counts = np.array([doc_freq[term] for term in vocabulary], dtype=np.float64)
+    tfidf.idf_ = np.log((1 + n_docs) / (1 + counts)) + 1
+    return tfidf, class_counts
+
+
+def train(args, tfidf, le, class_counts):
+    """Fit an SGD logistic regression with partial_fit over shuffled chunks"""
+    classes = np.arange(len(le.classes_))
+    total = sum(class_counts.values())
+    # partial_fit does not accept class_weight='balanced', so compute the same weights
+    class_weight = {
+        le.transform([label])[0]: total / (len(classes) * count)
+        for label, count in class_counts.items()
+    }
+    model = SGDClassifier(loss='log_loss', alpha=args.alpha, class_weight=class_weight,
+                          random_state=args.seed)
+    rng = np.random.default_rng(args.seed)
+    for epoch in range(args.epochs):
+        seen = 0
+        for texts, labels in iter_split(args):
+            order = rng.permutation(len(texts))
+            X = tfidf.transform([texts[i] for i in order])
+            y = le.transform([labels[i] for i in order])
+            model.partial_fit(X, y, classes=classes)
+            seen += len(texts)
+        print(f"Epoch {epoch + 1}/{args.epochs}: {seen:,} documents")
+    return model
+
+
+def evaluate(args, tfidf, le, model):
+    y_true = []
+    y_pred = []
+    for texts, labels in iter_split(args, test=True):
+        y_true.extend(le.transform(labels))
+        y_pred.extend(model.predict(tfidf.transform(texts)))
+    if not y_true:
+        print("No held-out rows to evaluate")
+        return
+    print("Accuracy:", accuracy_score(y_true, y_pred))
+    print(classification_report(y_true, y_pred, labels=np.arange(len(le.classes_)),
+                                target_names=le.classes_, zero_division=0))
+
+
+def check_vectorizer(args, tfidf):
+    """Compare the streamed vectorizer with TfidfVectorizer.fit on the same rows in memory"""
+    df = load_dataset(COLUMNS, args.dataset, exclude=args.exclude)
+    df = df[~is_test(df['video_id'], args.test_size)]
+    reference = TfidfVectorizer(**TFIDF_PARAMS).fit(full_text(df))
+    same_vocabulary = list(reference.get_feature_names_out()) == list(tfidf.get_feature_names_out())
+    same_idf = same_vocabulary and np.allclose(reference.idf_, tfidf.idf_)
+    print(f"Vectorizer check: vocabulary {'matches' if same_vocabulary else 'DIFFERS'}, "
+          f"idf {'matches' if same_idf else 'DIFFERS'}")
+    return same_vocabulary and same_idf
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the category classifier from the Parquet dataset in chunks")
+    parser.add_argument('--dataset', default=DEFAULT_DATASET, help="Dataset written by build_dataset.py")
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'output'), help="Directory for the .joblib artifacts")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="Rows vectorized and fitted per step")
+    parser.add_argument('--epochs', type=int, default=5)
+    parser.add_argument('--alpha', type=float, default=1e-5, help="SGD regularization strength")
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--include-all', dest='exclude', action='store_const', const=None,
+                        default=EXCLUDED_CATEGORIES, help="Also train on categories pre_proc.ipynb dropped")
+    parser.add_argument('--check-vectorizer', action='store_true',
+                        help="Verify the streamed vocabulary and idf against an in-memory fit (small datasets only)")
+    parser.add_argument('--publish', action='store_true', help="Publish the artifacts as a new model registry version")
+    parser.add_argument('--registry', default=os.getenv('MODEL_REGISTRY_PATH', os.path.join(BASE_DIR, '..', 'Web App', 'models')))
+    parser.add_argument('--version', help="Registry version name (default: timestamp)")
+    parser.add_argument('--activate', action='store_true', help="Mark the published version active")
+    args = parser.parse_args()
+
+    tfidf, class_counts = fit_vectorizer(args)
+    if args.check_vectorizer and not check_vectorizer(args, tfidf):
+        sys.exit(1)
+    le = LabelEncoder().fit(sorted(class_counts))
+    model = train(args, tfidf, le, class_counts)
+    evaluate(args, tfidf, le, model)
+
+    os.makedirs(args.output, exist_ok=True)
+    joblib.dump(tfidf, os.path.join(args.output, 'tfidf_vectorizer.joblib'))
+    joblib.dump(le, os.path.join(args.output, 'label_encoder.joblib'))
+    joblib.dump(model, os.path.join(args.output, MODEL_FILE))
+    print(f"✅ Saved artifacts to {args.output}")
+
+    if args.publish:
+        os.makedirs(args.registry, exist_ok=True)
+        version = publish(args.registry, args.output, args.version, MODEL_FILE)
+        if args.activate:
+            set_active(args.registry, version)
+        print(f"Published {version} to {args.registry}" + (" (active)" if args.activate else ""))
@@ -0,0 +1,117 @@
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+from bs4.element import Comment
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Web App'))
+import http_client
+from html_extract import extract_page
+
+
+def reference_extract(html):
+    """The BeautifulSoup extraction previously used by scrape_page"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    icon_link = soup.find('link', rel=lambda x: x and x.lower() in ['icon', 'shortcut icon'])
+    icon_href = icon_link.get('href', '') if icon_link else None
+
+    title = soup.title.string.strip() if soup.title else 'No Title Found'
+
+    for element in soup(['script', 'style', 'meta', 'link', 'nav', 'footer',
+                         'header', 'aside', 'form', 'button', 'a', 'noscript']):
+        element.decompose()
+
+    def tag_visible(element):
+        if element.parent.name in ['[document]', 'body', 'div', 'p', 'article',
+                                   'main', 'section', 'span', 'h1', 'h2', 'h3',
+                                   'h4', 'h5', 'h6']:
+            if isinstance(element, Comment):
+                return False
+            return True
+        return False
+
+    texts = soup.findAll(text=True)
+    visible_texts = filter(tag_visible, texts)
+    text = ' '.join(t.strip() for t in visible_texts if t.strip())
+    text = ' '.join(text.split())
+    return {'title': title, 'text': text, 'icon_href': icon_href}
+
+
+def fetch_corpus(url_file, corpus_dir):
+    """Save each URL in url_file as <sha1>.html in corpus_dir"""
+    os.makedirs(corpus_dir, exist_ok=True)
+    with open(url_file, 'r', encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip()]
+    for url in urls:
+        path = os.path.join(corpus_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+        if os.path.exists(path):
+            continue
+        try:
+            response = http_client.get(url, timeout=10)
+            response.raise_for_status()
+            with open(path, 'w', encoding='utf-8') as out:
+                out.write(response.text)
+            print(f"Saved {url}")
+        except Exception as e:
+            print(f"Error fetching {url}: {str(e)}")
+
+
+def run(corpus_dir, repeat):
+    files = sorted(name for name in os.listdir(corpus_dir) if name.endswith(('.html', '.htm')))
+    if not files:
+        print(f"No .html files in {corpus_dir}")
+        return 1
+
+    mismatches = 0
+    reference_time = 0.0
+    stream_time = 0.0
+    for name in files:
+        with open(os.path.join(corpus_dir, name), 'r', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            try:
+                expected = reference_extract(html)
+            except Exception as e:
+                # The old extractor fails on e.g. an empty <title>; the page was dropped
+                expected = f"error: {str(e)}"
+        reference_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            actual = extract_page(html)
+        stream_time += time.perf_counter() - started
+
+        if isinstance(expected, str):
+            print(f"SKIP {name}: reference {expected}")
+            continue
+        for field in ('title', 'text', 'icon_href'):
+            if expected[field] != actual[field]:
+                mismatches += 1
+                print(f"MISMATCH {name} [{field}]")
+                print(f"  reference: {str(expected[field])[:200]!r}")
+                print(f"  extractor: {str(actual[field])[:200]!r}")
+
+    print(f"\nPages: {len(files)}  Repeats: {repeat}  Mismatches: {mismatches}")
+    print(f"BeautifulSoup: {1000 * reference_time / (len(files) * repeat):.2f} ms/page")
+    print(f"html_extract:  {1000 * stream_time / (len(files) * repeat):.2f} ms/page")
+    if stream_time:
+        print(f"Speedup:       {reference_time / stream_time:.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check html_extract against the BeautifulSoup extractor and time both")
+    parser.add_argument('corpus', help="Directory of saved .html pages")
+    parser.add_argument('--fetch', metavar='URL_FILE', help="Download the URLs in this file into the corpus first")
+    parser.add_argument('--repeat', type=int, default=3, help="Extractions per page when timing")
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch_corpus(args.fetch, args.corpus)
+    sys.exit(run(args.corpus, args.repeat))
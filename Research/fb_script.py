@@ -1,6 +1,11 @@
-import requests
+import os
+import sys
+
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Web App'))
+import http_client
+
 def get_facebook_post_text(post_url):
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
@@ -8,7 +13,7 @@ def get_facebook_post_text(post_url):
     }
     
     try:
-        response = requests.get(post_url, headers=headers)
+        response = http_client.get(post_url, headers=headers, timeout=10)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
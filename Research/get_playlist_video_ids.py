@@ -5,14 +5,24 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-def get_playlist_video_ids(playlist_id):
-    # Get API key from .env file
-    api_key = os.getenv('YOUTUBE_API_KEY')
-    if not api_key:
-        print("Error: YouTube API key not found in .env file.")
-        return
+_youtube = None
+
+def get_client():
+    """Build the API client once and reuse it for every call"""
+    global _youtube
+    if _youtube is None:
+        # Get API key from .env file
+        api_key = os.getenv('YOUTUBE_API_KEY')
+        if not api_key:
+            print("Error: YouTube API key not found in .env file.")
+            return None
+        _youtube = build('youtube', 'v3', developerKey=api_key)
+    return _youtube
 
-    youtube = build('youtube', 'v3', developerKey=api_key)
+def get_playlist_video_ids(playlist_id, youtube=None):
+    youtube = youtube or get_client()
+    if youtube is None:
+        return
 
     video_ids = []
     next_page_token = None
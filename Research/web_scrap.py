@@ -1,36 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
-from bs4.element import Comment
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Web App'))
+import http_client
+from html_extract import extract_page
+
+# Same elements as before; unlike the web app, <noscript> text is kept
+REMOVED_TAGS = frozenset(['script', 'style', 'meta', 'link', 'nav', 'footer', 'header', 'aside', 'form', 'button', 'a'])
 
 def get_visible_text(url):
     try:
-        # Fetch webpage content
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers, timeout=10)
+        # Fetch webpage content over the shared, rate-limited session
+        response = http_client.get(url, timeout=10)
         response.raise_for_status()
         
-        # Create BeautifulSoup object
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove unwanted tags
-        for element in soup(['script', 'style', 'meta', 'link', 'nav', 'footer', 'header', 'aside', 'form', 'button', 'a']):
-            element.decompose()
-
-        # Function to check visible elements
-        def tag_visible(element):
-            if element.parent.name in ['[document]', 'body', 'div', 'p', 'article', 'main', 'section', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                if isinstance(element, Comment):
-                    return False
-                return True
-            return False
-
-        # Find all text elements
-        texts = soup.findAll(text=True)
-        visible_texts = filter(tag_visible, texts)
-        
-        # Clean and join text
-        text = ' '.join(t.strip() for t in visible_texts if t.strip())
-        text = ' '.join(text.split())  # Remove extra whitespace
+        # Extract visible text in a single streaming pass
+        text = extract_page(response.text, removed_tags=REMOVED_TAGS)['text']
         return text
 
     except Exception as e:
@@ -2,10 +2,12 @@ import os
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
 
+from youtube_proc import load_category_map, iter_video_details
+
 # Load environment variables from .env file
 load_dotenv()
 
-def get_youtube_video_details(video_id):
+def get_youtube_video_details(video_ids, region_code='US', include_captions=False):
     # Get API key from .env file
     api_key = os.getenv('YOUTUBE_API_KEY')
     if not api_key:
@@ -14,54 +16,29 @@ def get_youtube_video_details(video_id):
 
     youtube = build('youtube', 'v3', developerKey=api_key)
 
-    # Fetch video details
-    video_response = youtube.videos().list(
-        part="snippet",
-        id=video_id
-    ).execute()
-
-    if not video_response.get('items'):
-        print("No video found with the provided ID.")
-        return
-
-    video_snippet = video_response['items'][0]['snippet']
-
-    # Extract title, description, tags, and category ID
-    title = video_snippet.get('title', 'N/A')
-    description = video_snippet.get('description', 'N/A')
-    tags = video_snippet.get('tags', [])
-    category_id = video_snippet.get('categoryId', 'N/A')
-
-    # Fetch category name using category ID
-    category_response = youtube.videoCategories().list(
-        part="snippet",
-        id=category_id
-    ).execute()
-
-    category_name = category_response['items'][0]['snippet']['title'] if category_response.get('items') else 'N/A'
-
-    # Fetch captions (only English)
-    captions_response = youtube.captions().list(
-        part="snippet",
-        videoId=video_id
-    ).execute()
+    # One request for every category name, then one videos().list per 50 ids
+    categories = load_category_map(youtube, region_code)
 
-    english_captions = []
-    for caption in captions_response.get('items', []):
-        if caption['snippet']['language'] == 'en':
-            english_captions.append(caption['id'])
+    for video_id, details in iter_video_details(youtube, video_ids, categories, include_captions):
+        if not details:
+            print(f"No video found with the ID {video_id}.")
+            continue
 
-    # Display results
-    print(f"Title: {title}")
-    print(f"Description: {description}")
-    print(f"Tags: {', '.join(tags) if tags else 'N/A'}")
-    print(f"Video Category: {category_name}")
-    #print(f"English Captions: {', '.join(english_captions) if english_captions else 'N/A'}")
+        # Display results
+        print(f"Video ID: {video_id}")
+        print(f"Title: {details['title']}")
+        print(f"Description: {details['description']}")
+        print(f"Tags: {details['tags']}")
+        print(f"Video Category: {details['category']}")
+        if include_captions:
+            print(f"English Captions: {details['captions']}")
+        print()
 
 def main():
-    # Get video ID from user input
-    video_id = input("Enter YouTube Video ID: ")
-    get_youtube_video_details(video_id)
+    # Get one or more video IDs from user input
+    video_ids = input("Enter YouTube Video ID(s), separated by commas or spaces: ")
+    video_ids = [video_id for video_id in video_ids.replace(',', ' ').split() if video_id]
+    get_youtube_video_details(video_ids)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
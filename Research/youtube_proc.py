@@ -1,5 +1,10 @@
+import argparse
+import io
+import json
 import os
 import csv
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
@@ -13,162 +18,275 @@ def extract_playlist_id(playlist_link):
         return playlist_link.split('list=')[1].split('&')[0]
     return None
 
-def get_playlist_video_ids(youtube, playlist_id):
-    """Fetch all video IDs from a YouTube playlist."""
-    video_ids = []
-    next_page_token = None
+# videos().list accepts at most 50 ids per request
+VIDEO_BATCH_SIZE = 50
 
+def load_category_map(youtube, region_code='US'):
+    """Fetch every video category name for a region in a single request."""
     try:
-        while True:
-            try:
-                playlist_response = youtube.playlistItems().list(
-                    part="snippet",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-            except HttpError as e:
-                print(f"Error fetching playlist {playlist_id}: {str(e)}")
-                return []
-
-            for item in playlist_response.get('items', []):
-                video_id = item['snippet']['resourceId']['videoId']
-                video_ids.append(video_id)
+        response = youtube.videoCategories().list(
+            part="snippet",
+            regionCode=region_code
+        ).execute()
+    except HttpError as e:
+        print(f"Error fetching categories for region {region_code}: {str(e)}")
+        return {}
+    return {item['id']: item['snippet']['title'] for item in response.get('items', [])}
 
-            next_page_token = playlist_response.get('nextPageToken')
-            if not next_page_token:
-                break
+def resolve_categories(youtube, categories, category_ids):
+    """Look up category ids missing from the regional map, all in one request."""
+    missing = sorted(set(category_ids) - set(categories) - {'N/A'})
+    if not missing:
+        return
+    try:
+        response = youtube.videoCategories().list(
+            part="snippet",
+            id=','.join(missing)
+        ).execute()
+        for item in response.get('items', []):
+            categories[item['id']] = item['snippet']['title']
     except Exception as e:
-        print(f"Unexpected error processing playlist {playlist_id}: {str(e)}")
-        return []
+        print(f"Error fetching categories {', '.join(missing)}: {str(e)}")
+    for category_id in missing:
+        categories.setdefault(category_id, 'N/A')
 
-    return video_ids
-
-def get_video_details(youtube, video_id):
-    """Fetch video details with error handling."""
+def get_english_captions(youtube, video_id):
+    """List English caption track ids (costs 50 quota units per video)."""
     try:
-        # Get basic video info
-        video_response = youtube.videos().list(
+        captions_response = youtube.captions().list(
             part="snippet",
-            id=video_id
+            videoId=video_id
         ).execute()
+        return ', '.join([caption['id'] for caption in captions_response.get('items', [])
+                          if caption['snippet']['language'] == 'en']) or 'N/A'
+    except Exception as e:
+        print(f"Error fetching captions for video {video_id}: {str(e)}")
+        return 'N/A'
 
-        if not video_response.get('items'):
-            return None
-
-        video_snippet = video_response['items'][0]['snippet']
-        title = video_snippet.get('title', 'N/A')
-        description = video_snippet.get('description', 'N/A')
-        tags = ', '.join(video_snippet.get('tags', [])) if video_snippet.get('tags') else 'N/A'
-        category_id = video_snippet.get('categoryId', 'N/A')
+def iter_video_details(youtube, video_ids, categories, include_captions=False, raise_errors=False):
+    """Yield (video_id, details) for each video, fetching up to 50 videos per request.
 
-        # Get category name
+    Videos that are private, deleted or missing are yielded with details None.
+    With raise_errors, a failed request raises instead of yielding None for its batch.
+    """
+    for start in range(0, len(video_ids), VIDEO_BATCH_SIZE):
+        batch = video_ids[start:start + VIDEO_BATCH_SIZE]
         try:
-            category_response = youtube.videoCategories().list(
+            video_response = youtube.videos().list(
                 part="snippet",
-                id=category_id
+                id=','.join(batch),
+                maxResults=VIDEO_BATCH_SIZE
             ).execute()
-            category_name = category_response['items'][0]['snippet']['title'] if category_response.get('items') else 'N/A'
-        except Exception as e:
-            print(f"Error fetching category for video {video_id}: {str(e)}")
-            category_name = 'N/A'
+        except HttpError as e:
+            if raise_errors:
+                raise
+            print(f"Error fetching videos {batch[0]}..{batch[-1]}: {str(e)}")
+            for video_id in batch:
+                yield video_id, None
+            continue
 
-        # Get captions
-        try:
-            captions_response = youtube.captions().list(
-                part="snippet",
-                videoId=video_id
-            ).execute()
-            english_captions = ', '.join([caption['id'] for caption in captions_response.get('items', []) 
-                                        if caption['snippet']['language'] == 'en']) or 'N/A'
-        except Exception as e:
-            print(f"Error fetching captions for video {video_id}: {str(e)}")
-            english_captions = 'N/A'
-
-        return {
-            'title': title,
-            'description': description,
-            'tags': tags,
-            'category': category_name,
-            'captions': english_captions
-        }
+        snippets = {item['id']: item['snippet'] for item in video_response.get('items', [])}
+        resolve_categories(youtube, categories, [s.get('categoryId', 'N/A') for s in snippets.values()])
 
-    except HttpError as e:
-        print(f"Error fetching video {video_id}: {str(e)}")
-        return None
-    except Exception as e:
-        print(f"Unexpected error with video {video_id}: {str(e)}")
-        return None
+        for video_id in batch:
+            video_snippet = snippets.get(video_id)
+            if not video_snippet:
+                yield video_id, None
+                continue
+            yield video_id, {
+                'title': video_snippet.get('title', 'N/A'),
+                'description': video_snippet.get('description', 'N/A'),
+                'tags': ', '.join(video_snippet.get('tags', [])) if video_snippet.get('tags') else 'N/A',
+                'category': categories.get(video_snippet.get('categoryId', 'N/A'), 'N/A'),
+                'captions': get_english_captions(youtube, video_id) if include_captions else 'N/A'
+            }
+
+def get_video_details(youtube, video_id, categories=None, include_captions=True):
+    """Fetch details for a single video; prefer iter_video_details for many."""
+    categories = {} if categories is None else categories
+    for _, details in iter_video_details(youtube, [video_id], categories, include_captions):
+        return details
+    return None
+
+CSV_FIELDS = ['PlaylistID', 'VideoID', 'Title', 'Description', 'Tags', 'English Captions', 'Video Category']
+
+class HarvestCheckpoint:
+    """Per-playlist progress plus the committed length of the output CSV.
+
+    Every page of rows is appended and checkpointed under one lock, so after a
+    crash the CSV is truncated back to the last committed page and each
+    playlist resumes from the page token after it.
+    """
+
+    def __init__(self, csv_path, checkpoint_path, restart=False):
+        self.csv_path = csv_path
+        self.checkpoint_path = checkpoint_path
+        self.lock = threading.Lock()
+        self.state = {'csv_bytes': 0, 'playlists': {}}
+        if not restart and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+        # Drop anything written after the last checkpoint, then reopen for appending
+        if self.state['csv_bytes'] and os.path.exists(csv_path):
+            with open(csv_path, 'r+b') as f:
+                f.truncate(self.state['csv_bytes'])
+            self.csvfile = open(csv_path, 'a', newline='', encoding='utf-8')
+        else:
+            self.csvfile = open(csv_path, 'w', newline='', encoding='utf-8')
+            csv.DictWriter(self.csvfile, fieldnames=CSV_FIELDS).writeheader()
+            self._commit()
+
+    def playlist(self, playlist_id):
+        with self.lock:
+            return dict(self.state['playlists'].get(playlist_id, {'status': 'pending', 'page_token': None, 'videos': 0}))
+
+    def append_page(self, playlist_id, rows, next_page_token):
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=CSV_FIELDS).writerows(rows)
+        with self.lock:
+            self.csvfile.write(buffer.getvalue())
+            entry = self.state['playlists'].setdefault(playlist_id, {'status': 'pending', 'page_token': None, 'videos': 0})
+            entry['videos'] += len(rows)
+            entry['page_token'] = next_page_token
+            entry['status'] = 'in_progress' if next_page_token else 'done'
+            self._commit()
+
+    def mark_failed(self, playlist_id, error):
+        with self.lock:
+            entry = self.state['playlists'].setdefault(playlist_id, {'status': 'pending', 'page_token': None, 'videos': 0})
+            entry['status'] = 'failed'
+            entry['error'] = error
+            self._commit()
+
+    def _commit(self):
+        self.csvfile.flush()
+        os.fsync(self.csvfile.fileno())
+        self.state['csv_bytes'] = os.path.getsize(self.csv_path)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def close(self):
+        self.csvfile.close()
+
+_clients = threading.local()
+
+def get_client(api_key):
+    """One API client per thread; the underlying httplib2 connection is not thread-safe."""
+    if not hasattr(_clients, 'youtube'):
+        _clients.youtube = build('youtube', 'v3', developerKey=api_key)
+    return _clients.youtube
+
+def harvest_playlist(api_key, playlist_id, categories, checkpoint, include_captions, stop):
+    """Write one playlist page by page, continuing from its checkpointed page token."""
+    youtube = get_client(api_key)
+    progress = checkpoint.playlist(playlist_id)
+    if progress['status'] == 'done':
+        return 'skipped', progress['videos']
+    next_page_token = progress['page_token']
+
+    while not stop.is_set():
+        playlist_response = youtube.playlistItems().list(
+            part="snippet",
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=next_page_token
+        ).execute()
+        video_ids = [item['snippet']['resourceId']['videoId'] for item in playlist_response.get('items', [])]
+
+        rows = []
+        for video_id, video_details in iter_video_details(youtube, video_ids, categories,
+                                                          include_captions, raise_errors=True):
+            if not video_details:
+                continue
+            rows.append({
+                'PlaylistID': playlist_id,
+                'VideoID': video_id,
+                'Title': video_details['title'],
+                'Description': video_details['description'],
+                'Tags': video_details['tags'],
+                'English Captions': video_details['captions'],
+                'Video Category': video_details['category']
+            })
+
+        next_page_token = playlist_response.get('nextPageToken')
+        checkpoint.append_page(playlist_id, rows, next_page_token)
+        if not next_page_token:
+            return 'done', checkpoint.playlist(playlist_id)['videos']
+    return 'stopped', checkpoint.playlist(playlist_id)['videos']
 
 def main():
+    parser = argparse.ArgumentParser(description="Harvest video details for every playlist in a list of links")
+    parser.add_argument('--playlists', default='playlist.txt', help="File with one playlist link per line")
+    parser.add_argument('--output', default='playlist_video_details.csv')
+    parser.add_argument('--checkpoint', help="Progress file (default: <output>.checkpoint.json)")
+    parser.add_argument('--restart', action='store_true', help="Ignore the checkpoint and start a new CSV")
+    parser.add_argument('--workers', type=int, default=4, help="Playlists harvested concurrently")
+    parser.add_argument('--region', default='US', help="Region whose category names are preloaded")
+    parser.add_argument('--captions', action='store_true',
+                        help="Also list English caption tracks (one extra, expensive request per video)")
+    args = parser.parse_args()
+
     # Get API key from .env file
     api_key = os.getenv('YOUTUBE_API_KEY')
     if not api_key:
         print("Error: YouTube API key not found in .env file.")
         return
 
+    # Read playlist links
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-    except Exception as e:
-        print(f"Error initializing YouTube API: {str(e)}")
-        return
-
-    # Read playlist links from playlist.txt
-    try:
-        with open('playlist.txt', 'r') as file:
+        with open(args.playlists, 'r') as file:
             playlist_links = file.read().splitlines()
     except FileNotFoundError:
-        print("Error: playlist.txt file not found")
+        print(f"Error: {args.playlists} file not found")
         return
 
-    # Open CSV file for writing
-    with open('playlist_video_details.csv', 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['PlaylistID', 'VideoID', 'Title', 'Description', 'Tags', 'English Captions', 'Video Category']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for playlist_link in playlist_links:
-            playlist_id = extract_playlist_id(playlist_link)
-            if not playlist_id:
-                print(f"Skipping invalid playlist link: {playlist_link}")
-                continue
+    playlist_ids = []
+    for playlist_link in playlist_links:
+        playlist_id = extract_playlist_id(playlist_link)
+        if not playlist_id:
+            print(f"Skipping invalid playlist link: {playlist_link}")
+        elif playlist_id not in playlist_ids:
+            playlist_ids.append(playlist_id)
 
-            print(f"Processing Playlist ID: {playlist_id}")
+    try:
+        categories = load_category_map(get_client(api_key), args.region)
+    except Exception as e:
+        print(f"Error initializing YouTube API: {str(e)}")
+        return
 
+    checkpoint = HarvestCheckpoint(args.output, args.checkpoint or f"{args.output}.checkpoint.json", args.restart)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=args.workers)
+    try:
+        futures = {
+            executor.submit(harvest_playlist, api_key, playlist_id, categories, checkpoint, args.captions, stop): playlist_id
+            for playlist_id in playlist_ids
+        }
+        for future in as_completed(futures):
+            playlist_id = futures[future]
             try:
-                video_ids = get_playlist_video_ids(youtube, playlist_id)
+                status, videos = future.result()
+                print(f"Playlist {playlist_id}: {status} ({videos} videos)")
+            except HttpError as e:
+                print(f"Error processing playlist {playlist_id}: {str(e)}")
+                checkpoint.mark_failed(playlist_id, str(e))
+                # Out of quota: every other request would fail too
+                if e.resp.status == 403 and 'quota' in str(e).lower():
+                    stop.set()
             except Exception as e:
                 print(f"Error processing playlist {playlist_id}: {str(e)}")
-                continue
-
-            if not video_ids:
-                print(f"No videos found in playlist: {playlist_id}")
-                continue
+                checkpoint.mark_failed(playlist_id, str(e))
+    except KeyboardInterrupt:
+        stop.set()
+        print("Interrupted; run again to resume from the checkpoint")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        checkpoint.close()
 
-            for video_id in video_ids:
-                print(f"  Fetching details for Video ID: {video_id}")
-                try:
-                    video_details = get_video_details(youtube, video_id)
-                except Exception as e:
-                    print(f"Error processing video {video_id}: {str(e)}")
-                    continue
-
-                if not video_details:
-                    print(f"    No details found for Video ID: {video_id}")
-                    continue
-
-                # Write data to CSV
-                writer.writerow({
-                    'PlaylistID': playlist_id,
-                    'VideoID': video_id,
-                    'Title': video_details['title'],
-                    'Description': video_details['description'],
-                    'Tags': video_details['tags'],
-                    'English Captions': video_details['captions'],
-                    'Video Category': video_details['category']
-                })
-
-    print("Data saved to playlist_video_details.csv")
+    print(f"Data saved to {args.output}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,27 +1,73 @@
-import yt_dlp
+import argparse
 import csv
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import yt_dlp
+
+YDL_OPTS = {
+    'quiet': True,
+    'skip_download': True,
+    'extract_flat': False,
+}
+CSV_FIELDS = ['Title', 'Description', 'Category', 'URL']
+
+# One YoutubeDL per worker process, created by init_worker
+_ydl = None
+
+def init_worker():
+    global _ydl
+    _ydl = yt_dlp.YoutubeDL(YDL_OPTS)
 
 def get_video_details(url):
-    ydl_opts = {
-        'quiet': True,
-        'skip_download': True,
-        'extract_flat': False,
-    }
-    
+    ydl = _ydl or yt_dlp.YoutubeDL(YDL_OPTS)
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            return {
-                'title': info.get('title', 'N/A'),
-                'description': info.get('description', 'N/A'),
-                'category': info.get('categories', ['N/A'])[0],
-                'url': url
-            }
+        info = ydl.extract_info(url, download=False)
+        return {
+            'title': info.get('title', 'N/A'),
+            'description': info.get('description', 'N/A'),
+            'category': (info.get('categories') or ['N/A'])[0],
+            'url': url
+        }
     except Exception as e:
         print(f"❌ Error processing {url}: {str(e)}")
         return None
 
+def video_key(url):
+    """Identify a video by its id so watch/short/youtu.be forms dedupe together"""
+    parsed = urlparse(url.strip())
+    if parsed.netloc.endswith('youtu.be'):
+        return parsed.path.lstrip('/').split('/')[0]
+    video_id = parse_qs(parsed.query).get('v')
+    if video_id:
+        return video_id[0]
+    if parsed.path.startswith(('/shorts/', '/embed/')):
+        return parsed.path.split('/')[2]
+    return url.strip()
+
+def read_csv_rows(path):
+    """Read a CSV written as UTF-8 or, by older runs on Windows, as cp1252"""
+    for encoding in ('utf-8', 'cp1252'):
+        try:
+            with open(path, 'r', newline='', encoding=encoding) as f:
+                return list(csv.DictReader(f))
+        except UnicodeDecodeError:
+            continue
+    with open(path, 'r', newline='', encoding='utf-8', errors='replace') as f:
+        return list(csv.DictReader(f))
+
+def load_done_keys(pattern):
+    """Collect the videos already present in any existing output CSV"""
+    done = set()
+    for path in sorted(glob.glob(pattern)):
+        rows = read_csv_rows(path)
+        done.update(video_key(row['URL']) for row in rows if row.get('URL'))
+        print(f"Loaded {len(rows)} rows from {path}")
+    return done
+
 def print_video_details(details):
     print("\n" + "="*50)
     print(f"📺 Title: {details['title']}")
@@ -31,45 +77,79 @@ def print_video_details(details):
     print("="*50 + "\n")
 
 def main():
+    parser = argparse.ArgumentParser(description="Extract YouTube video metadata with yt-dlp across several processes")
+    parser.add_argument('--urls', default='videourl.txt', help="File with one video URL per line")
+    parser.add_argument('--output', default='video_details.csv', help="CSV that new rows are appended to")
+    parser.add_argument('--existing', default='video_details*.csv', help="Glob of CSVs whose URLs are skipped")
+    parser.add_argument('--failed', default='video_details.failed.txt', help="URLs that failed; skipped unless --retry-failed")
+    parser.add_argument('--retry-failed', action='store_true')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--verbose', action='store_true', help="Print each video's details")
+    args = parser.parse_args()
+
     print("Starting YouTube video details extraction...")
     print(f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     # Read video URLs
     try:
-        with open('videourl.txt', 'r') as f:
+        with open(args.urls, 'r') as f:
             urls = [url.strip() for url in f.readlines() if url.strip()]
     except FileNotFoundError:
-        print("Error: videourl.txt not found in current directory")
+        print(f"Error: {args.urls} not found in current directory")
         return
 
     if not urls:
-        print("No URLs found in videourl.txt")
+        print(f"No URLs found in {args.urls}")
         return
 
-    print(f"Found {len(urls)} video URLs to process\n")
+    # Skip videos already saved by this or earlier runs
+    done = load_done_keys(args.existing)
+    if not args.retry_failed and os.path.exists(args.failed):
+        with open(args.failed, 'r') as f:
+            done.update(video_key(url) for url in f if url.strip())
+    pending = list({video_key(url): url for url in urls if video_key(url) not in done}.values())
 
-    # Process videos
+    print(f"Found {len(urls)} video URLs, {len(pending)} left to process\n")
+    if not pending:
+        return
+
+    # Process videos, appending each row as soon as it arrives
     successful = 0
-    with open('video_details.csv', 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=['Title', 'Description', 'Category', 'URL'])
-        writer.writeheader()
-
-        for i, url in enumerate(urls, 1):
-            print(f"Processing video {i}/{len(urls)}...")
-            details = get_video_details(url)
-            
-            if details:
-                print_video_details(details)
+    write_header = not os.path.exists(args.output) or os.path.getsize(args.output) == 0
+    with open(args.output, 'a', newline='', encoding='utf-8') as csvfile, \
+            open(args.failed, 'a', encoding='utf-8') as failedfile, \
+            ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as executor:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+        if write_header:
+            writer.writeheader()
+
+        futures = {executor.submit(get_video_details, url): url for url in pending}
+        try:
+            for i, future in enumerate(as_completed(futures), 1):
+                details = future.result()
+                if not details:
+                    failedfile.write(futures[future] + '\n')
+                    failedfile.flush()
+                    continue
+
+                if args.verbose:
+                    print_video_details(details)
                 writer.writerow({
                     'Title': details['title'],
                     'Description': details['description'],
                     'Category': details['category'],
                     'URL': details['url']
                 })
+                csvfile.flush()
                 successful += 1
+                if i % 100 == 0:
+                    print(f"Processed {i}/{len(pending)} videos")
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            print("Interrupted; run again to continue where this run stopped")
 
-    print(f"\n✅ Processing complete! Successfully processed {successful}/{len(urls)} videos")
-    print(f"📁 Results saved to video_details.csv")
+    print(f"\n✅ Processing complete! Successfully processed {successful}/{len(pending)} videos")
+    print(f"📁 Results appended to {args.output}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
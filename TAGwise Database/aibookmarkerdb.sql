@@ -68,25 +68,200 @@ INSERT INTO `content_details` (`id`, `url`, `title`, `site_name`, `category`, `t
 (31, 'https://www.reddit.com/r/NewTubers/comments/1jqfqt4/am_i_just_lucky_or_is_there_an_explanation_for/', 'Am I just lucky or is there an explanation for this ?', 'reddit.com', 'Entertainment & Media', 'just,second,content', 'am i just lucky or is there an explanation for this i just started my channel a little over 15 days ago in the gaming niche more specifically storytelling my content is in french there are english subtitles but i haven t had the time yet to fix them for the second video the one about halo the channel username is sublimestorytv or just sublime story with a yellow s as avatar i ve posted my second video so far and i ve just reached the following stats 45k total views 4 100 watch hours 1 800 subscr...', 'https://www.reddit.com/favicon.ico', '2025-04-03 11:50:39'),
 (32, 'https://www.reddit.com/r/selfimprovement/comments/1jprkbq/stopped_drinking_and_smoking_cannabis_and_i_dont/', 'Stopped drinking and smoking cannabis and I don\'t feel any better.', 'reddit.com', 'Entertainment & Media', 'better,feeling,myself,things,instead', 'stopped drinking and smoking cannabis and i don t feel any better i 32m smoked pot and drank something like 4 6 beers daily for the better part of a decade pretty much the entirety of my 20s i also use nicotine vape after smoking cigs for 5 years until i was about 23 over 2024 i tapered myself off the beers was down to only 2 a night and stopped completely at the beginning of this year i also stopped smoking weed in november so i m nearly half a year off pot and 3 months of no alcohol while i m ...', 'https://www.reddit.com/favicon.ico', '2025-04-03 11:51:12');
 
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `bookmark_jobs`
+--
+
+CREATE TABLE `bookmark_jobs` (
+  `id` int(11) NOT NULL,
+  `bookmark_id` int(11) NOT NULL,
+  `url` varchar(2083) NOT NULL,
+  `status` enum('pending','running','done','failed') NOT NULL DEFAULT 'pending',
+  `attempts` int(11) NOT NULL DEFAULT 0,
+  `error` text DEFAULT NULL,
+  `available_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  `claimed_at` timestamp NULL DEFAULT NULL,
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `bookmark_tags`
+--
+
+CREATE TABLE `bookmark_tags` (
+  `bookmark_id` int(11) NOT NULL,
+  `tag` varchar(255) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `bookmark_tags`
+--
+
+INSERT INTO `bookmark_tags` (`bookmark_id`, `tag`) VALUES
+(8, 'recipes'),
+(8, 'easy'),
+(8, 'food'),
+(8, 'recipe'),
+(8, 'cooking'),
+(9, 'local'),
+(9, 'app'),
+(9, 'building'),
+(9, 'design'),
+(9, 'models'),
+(10, 'highlights'),
+(10, '2025'),
+(10, 'match'),
+(10, 'cricket'),
+(10, 'today'),
+(11, 'highlights'),
+(11, '2024'),
+(11, 'match'),
+(11, 'may'),
+(11, 'cricket'),
+(12, 'driving'),
+(12, 'new'),
+(12, 'digital'),
+(12, 'design'),
+(12, 'electric'),
+(13, 'iphone'),
+(13, 'electric'),
+(13, 'mkbhd'),
+(13, 'rock'),
+(13, 'focus'),
+(14, 'tesla'),
+(14, 'model'),
+(14, 'owners'),
+(14, 'france'),
+(14, 'vehicles'),
+(15, 'animals'),
+(15, 'animal'),
+(15, 'can'),
+(15, 'adorable'),
+(15, 'you'),
+(16, 'cat'),
+(16, 'expensive'),
+(16, 'top'),
+(16, 'world'),
+(16, 'most'),
+(17, 'university'),
+(17, 'job'),
+(17, 'engineering'),
+(17, 'out'),
+(17, 'how'),
+(19, 'paper'),
+(19, 'result'),
+(20, 'trump'),
+(20, 'national'),
+(20, 'economic'),
+(20, 'president'),
+(20, 'workers'),
+(22, 'president'),
+(22, 'decision'),
+(22, 'chinese'),
+(22, 'china'),
+(23, 'art'),
+(24, '2025'),
+(25, 'chris'),
+(25, 'harris'),
+(25, 'stage'),
+(25, 'ryan'),
+(25, 'studios'),
+(26, 'friends'),
+(26, 'disney'),
+(26, '2025'),
+(26, 'april'),
+(26, 'range'),
+(27, 'diy'),
+(27, 'crafts'),
+(27, 'mini'),
+(27, 'minute'),
+(27, 'craft'),
+(28, 'difference between'),
+(28, 'education'),
+(28, 'style'),
+(29, 'winter'),
+(29, 'weather'),
+(29, 'still'),
+(29, 'also'),
+(29, 'time'),
+(30, 'professor'),
+(30, 'missing'),
+(30, 'weeks'),
+(30, 'scientist'),
+(30, 'reach'),
+(31, 'just'),
+(31, 'second'),
+(31, 'content'),
+(32, 'better'),
+(32, 'feeling'),
+(32, 'myself'),
+(32, 'things'),
+(32, 'instead');
+
 --
 -- Indexes for dumped tables
 --
 
+--
+-- Indexes for table `bookmark_jobs`
+--
+ALTER TABLE `bookmark_jobs`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_bookmark_jobs_status` (`status`,`id`),
+  ADD KEY `idx_bookmark_jobs_bookmark` (`bookmark_id`);
+
+--
+-- Indexes for table `bookmark_tags`
+--
+ALTER TABLE `bookmark_tags`
+  ADD PRIMARY KEY (`bookmark_id`,`tag`),
+  ADD KEY `idx_bookmark_tags_tag` (`tag`);
+
 --
 -- Indexes for table `content_details`
 --
 ALTER TABLE `content_details`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_created_id` (`created_at`,`id`),
+  ADD KEY `idx_category_created_id` (`category`,`created_at`,`id`),
+  ADD FULLTEXT KEY `ft_content_search` (`title`,`tags`,`site_name`,`content`);
 
 --
 -- AUTO_INCREMENT for dumped tables
 --
 
+--
+-- AUTO_INCREMENT for table `bookmark_jobs`
+--
+ALTER TABLE `bookmark_jobs`
+  MODIFY `id` int(11) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `content_details`
 --
 ALTER TABLE `content_details`
   MODIFY `id` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=33;
+
+--
+-- Constraints for dumped tables
+--
+
+--
+-- Constraints for table `bookmark_jobs`
+--
+ALTER TABLE `bookmark_jobs`
+  ADD CONSTRAINT `fk_bookmark_jobs_bookmark` FOREIGN KEY (`bookmark_id`) REFERENCES `content_details` (`id`) ON DELETE CASCADE;
+
+--
+-- Constraints for table `bookmark_tags`
+--
+ALTER TABLE `bookmark_tags`
+  ADD CONSTRAINT `fk_bookmark_tags_bookmark` FOREIGN KEY (`bookmark_id`) REFERENCES `content_details` (`id`) ON DELETE CASCADE;
 COMMIT;
 
 /*!40101 SET CHARACTER_SET_CLIENT=@OLD_CHARACTER_SET_CLIENT */;
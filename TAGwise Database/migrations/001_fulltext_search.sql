@@ -0,0 +1,13 @@
+--
+-- Migration 001: FULLTEXT index for /explore search
+--
+-- Replaces the leading-wildcard LIKE scan with an indexed, ranked search
+-- over title, tags, site name and the stored content excerpt.
+--
+-- Plain ALTER TABLE so it runs on MySQL 8.0+ as well as MariaDB; apply it
+-- once to databases created before the index, aibookmarkerdb.sql already
+-- has it.
+--
+
+ALTER TABLE `content_details`
+  ADD FULLTEXT KEY `ft_content_search` (`title`, `tags`, `site_name`, `content`);
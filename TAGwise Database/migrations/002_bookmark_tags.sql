@@ -0,0 +1,35 @@
+--
+-- Migration 002: normalized tag table
+--
+-- Stores one row per (bookmark, tag) so tag counts and tag filters are
+-- index lookups instead of splitting the comma-separated `tags` column
+-- on every dashboard load. `content_details`.`tags` is kept for display.
+--
+
+CREATE TABLE IF NOT EXISTS `bookmark_tags` (
+  `bookmark_id` int(11) NOT NULL,
+  `tag` varchar(255) NOT NULL,
+  PRIMARY KEY (`bookmark_id`,`tag`),
+  KEY `idx_bookmark_tags_tag` (`tag`),
+  CONSTRAINT `fk_bookmark_tags_bookmark` FOREIGN KEY (`bookmark_id`) REFERENCES `content_details` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Backfill from the existing `tags` column (no limit on tags per row)
+--
+
+INSERT IGNORE INTO `bookmark_tags` (`bookmark_id`, `tag`)
+WITH RECURSIVE `split_tags` AS (
+  SELECT `id`,
+         TRIM(SUBSTRING_INDEX(`tags`, ',', 1)) AS `tag`,
+         IF(LOCATE(',', `tags`) > 0, SUBSTRING(`tags`, LOCATE(',', `tags`) + 1), NULL) AS `rest`
+  FROM `content_details`
+  WHERE `tags` IS NOT NULL AND `tags` != ''
+  UNION ALL
+  SELECT `id`,
+         TRIM(SUBSTRING_INDEX(`rest`, ',', 1)),
+         IF(LOCATE(',', `rest`) > 0, SUBSTRING(`rest`, LOCATE(',', `rest`) + 1), NULL)
+  FROM `split_tags`
+  WHERE `rest` IS NOT NULL
+)
+SELECT `id`, LEFT(`tag`, 255) FROM `split_tags` WHERE `tag` != '';
@@ -0,0 +1,14 @@
+--
+-- Migration 003: indexes for keyset pagination on /explore
+--
+-- Pages are ordered by (`created_at`, `id`) newest first, optionally
+-- filtered by category, so both orders can be read straight off an index.
+--
+-- Plain ALTER TABLE so it runs on MySQL 8.0+ as well as MariaDB; apply it
+-- once to databases created before the indexes, aibookmarkerdb.sql already
+-- has them.
+--
+
+ALTER TABLE `content_details`
+  ADD KEY `idx_created_id` (`created_at`,`id`),
+  ADD KEY `idx_category_created_id` (`category`,`created_at`,`id`);
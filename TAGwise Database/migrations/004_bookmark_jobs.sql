@@ -0,0 +1,24 @@
+--
+-- Migration 004: durable queue for /enqueue
+--
+-- /enqueue inserts a pending `content_details` row and a job in one
+-- transaction; background workers claim jobs with FOR UPDATE SKIP LOCKED
+-- (MariaDB 10.6+ / MySQL 8.0+), classify the page and fill in the row.
+--
+
+CREATE TABLE IF NOT EXISTS `bookmark_jobs` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `bookmark_id` int(11) NOT NULL,
+  `url` varchar(2083) NOT NULL,
+  `status` enum('pending','running','done','failed') NOT NULL DEFAULT 'pending',
+  `attempts` int(11) NOT NULL DEFAULT 0,
+  `error` text DEFAULT NULL,
+  `available_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  `claimed_at` timestamp NULL DEFAULT NULL,
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `idx_bookmark_jobs_status` (`status`,`id`),
+  KEY `idx_bookmark_jobs_bookmark` (`bookmark_id`),
+  CONSTRAINT `fk_bookmark_jobs_bookmark` FOREIGN KEY (`bookmark_id`) REFERENCES `content_details` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
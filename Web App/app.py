@@ -1,17 +1,36 @@
 from flask import Flask, request, jsonify
-import requests
-from bs4 import BeautifulSoup, Comment
 import joblib
+import numpy as np
 import re
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode, urlunparse
 import os
+import signal
+import threading
+import time
 from googleapiclient.discovery import build
 import praw
 from dotenv import load_dotenv
 from flask_cors import CORS
-from flask import render_template, redirect, url_for
+from flask import render_template, redirect, url_for, Response
 import pymysql
 import tweepy
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+import http_client
+from cache import TTLCache, SQLiteTier
+from favicon_store import FaviconStore, MAX_ICON_BYTES
+from db import ConnectionPool
+from query_cache import QueryCache
+from html_extract import VisibleTextParser
+from model_registry import ModelRegistry
+from jobs import JobQueue, JobWorkers
+from importer import BookmarkImporter, ImportGuard, parse_bookmarks
+from text_normalize import clean_text, normalize_text, normalize_batch
 
 app = Flask(__name__)
 CORS(app)
@@ -24,8 +43,76 @@ REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID')
 REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
 TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')  # Added for Twitter API
 
-# Load the predictor model once at startup
-predictor = None
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Versioned models; the artifacts next to app.py are used until a version is activated
+MODEL_REGISTRY_PATH = os.getenv('MODEL_REGISTRY_PATH', os.path.join(APP_DIR, 'models'))
+
+# Sample inputs run through a new model version before it replaces the active one
+WARMUP_TEXTS = [
+    'learn python programming tutorial for beginners',
+    'latest football match highlights and scores',
+    'easy chicken curry recipe cooking at home'
+]
+
+# Limits for /predict/batch
+MAX_BATCH_SIZE = 500
+
+# Shared MySQL connection pool used by every route
+db_pool = ConnectionPool(
+    max_size=int(os.getenv('DB_POOL_SIZE', 10)),
+    timeout=float(os.getenv('DB_POOL_TIMEOUT', 5)),
+    host=os.getenv('DB_HOST', 'localhost'),
+    user=os.getenv('DB_USER', 'root'),
+    password=os.getenv('DB_PASSWORD', ''),
+    database=os.getenv('DB_NAME', 'aibookmarkerdb'),
+    charset='utf8mb4',
+    cursorclass=pymysql.cursors.DictCursor
+)
+
+# Dashboard and explore query results, invalidated by /save, /delete and /update;
+# QUERY_CACHE_TTL picks up writes made outside the server, such as the import CLI
+query_cache = QueryCache(max_entries=int(os.getenv('QUERY_CACHE_SIZE', 256)),
+                         max_age=float(os.getenv('QUERY_CACHE_TTL', 60)))
+QUERY_CACHE_TABLES = ('content_details', 'bookmark_tags')
+
+# Extracted page content, keyed by canonical URL
+CONTENT_CACHE_SIZE = int(os.getenv('CONTENT_CACHE_SIZE', 1024))
+CONTENT_CACHE_TTL = int(os.getenv('CONTENT_CACHE_TTL', 900))
+CONTENT_CACHE_PATH = os.getenv('CONTENT_CACHE_PATH')  # Optional SQLite file for the disk tier
+content_cache = TTLCache(
+    max_entries=CONTENT_CACHE_SIZE,
+    ttl=CONTENT_CACHE_TTL,
+    disk=SQLiteTier(CONTENT_CACHE_PATH, table='content') if CONTENT_CACHE_PATH else None
+)
+
+# Category and tags per (model artifacts, cleaned text); persisted so restarts start warm
+PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', 4096))
+PREDICTION_CACHE_TTL = int(os.getenv('PREDICTION_CACHE_TTL', 30 * 24 * 3600))
+PREDICTION_CACHE_ROWS = int(os.getenv('PREDICTION_CACHE_ROWS', 100000))
+PREDICTION_CACHE_PATH = os.getenv('PREDICTION_CACHE_PATH', os.path.join(APP_DIR, 'prediction_cache.sqlite3'))
+prediction_cache = TTLCache(
+    max_entries=PREDICTION_CACHE_SIZE,
+    ttl=PREDICTION_CACHE_TTL,
+    disk=SQLiteTier(PREDICTION_CACHE_PATH, table='predictions', max_rows=PREDICTION_CACHE_ROWS) if PREDICTION_CACHE_PATH else None
+)
+
+# Resolved favicons and their locally stored bytes
+FAVICON_STORE_PATH = os.getenv('FAVICON_STORE_PATH', os.path.join(APP_DIR, 'favicons'))
+FAVICON_MAX_AGE = 30 * 24 * 3600
+favicon_store = FaviconStore(FAVICON_STORE_PATH)
+
+# Bookmark imports: per-import progress and checkpoint files
+IMPORT_PATH = os.getenv('IMPORT_PATH', os.path.join(APP_DIR, 'imports'))
+IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', 100))
+import_guard = ImportGuard()
+
+# Visible text collected before a page download is cut short
+SCRAPE_TEXT_LIMIT = int(os.getenv('SCRAPE_TEXT_LIMIT', 20000))
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+                   'ref', 'ref_src', 'si', 'feature'}
 
 custom_stop_words = {
     'video', 'watch', 'channel', 'subscribe', 'like', 'comment', 
@@ -113,8 +200,7 @@ def handle_youtube(url):
         return {
             'title': title,
             'text': clean_text(text),
-            'site_name': get_site_name(url),
-            'favicon_url': get_favicon_url(url)
+            'site_name': get_site_name(url)
         }
     except Exception as e:
         app.logger.error(f"YouTube API error: {str(e)}")
@@ -137,8 +223,7 @@ def handle_reddit(url):
         return {
             'title': title,
             'text': clean_text(text),
-            'site_name': get_site_name(url),
-            'favicon_url': get_favicon_url(url)
+            'site_name': get_site_name(url)
         }
     except Exception as e:
         app.logger.error(f"Reddit API error: {str(e)}")
@@ -162,8 +247,7 @@ def handle_twitter(url):
             return {
                 'title': title,
                 'text': clean_text(text),
-                'site_name': get_site_name(url),
-                'favicon_url': get_favicon_url(url)
+                'site_name': get_site_name(url)
             }
         else:
             app.logger.error(f"Twitter API returned no data for tweet ID: {tweet_id}")
@@ -176,72 +260,111 @@ def handle_twitter(url):
         return None
 
 class CategoryPredictor:
-    def __init__(self):
-        self.tfidf = joblib.load('tfidf_vectorizer.joblib')
-        self.le = joblib.load('label_encoder.joblib')
-        self.model = joblib.load('xgboost_model.joblib')
+    def __init__(self, model_dir=APP_DIR, memo=None):
+        self.version = None
+        self.memo = memo
+        self.fingerprint = self._fingerprint(model_dir)
+        self.tfidf = joblib.load(os.path.join(model_dir, 'tfidf_vectorizer.joblib'))
+        self.le = joblib.load(os.path.join(model_dir, 'label_encoder.joblib'))
+        self.model = joblib.load(os.path.join(model_dir, 'xgboost_model.joblib'))
+        self._build_tag_tables()
+
+    @staticmethod
+    def _fingerprint(model_dir):
+        """Identify the exact artifacts loaded, so replaced files never reuse memoized results"""
+        digest = hashlib.sha1()
+        for name in ('tfidf_vectorizer.joblib', 'label_encoder.joblib', 'xgboost_model.joblib'):
+            stat = os.stat(os.path.join(model_dir, name))
+            digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _build_tag_tables(self):
+        """Precompute each feature's tag words once instead of on every request"""
+        self.vocabulary = self.tfidf.get_feature_names_out()
+        self.feature_words = [
+            tuple(word for word in feature.split() if word not in custom_stop_words and len(word) > 2)
+            for feature in self.vocabulary
+        ]
+        self.feature_tags = [' '.join(words) for words in self.feature_words]
+        self.tag_mask = np.array([bool(words) for words in self.feature_words])
     
     def predict(self, text):
-        text_vector = self.tfidf.transform([text])
+        text_vector = self.tfidf.transform([normalize_text(text)])
         prediction = self.model.predict(text_vector)
         return self.le.inverse_transform(prediction)[0]
-    
+
+    def predict_batch(self, texts, top_n=5):
+        """Classify and tag many texts, reusing memoized results for texts seen before"""
+        if not texts:
+            return []
+        if self.memo is None:
+            return self.classify_batch(texts, top_n)
+
+        keys = [hashlib.sha1(f"{self.fingerprint}:{top_n}:{text}".encode('utf-8')).hexdigest()
+                for text in texts]
+        results = [self.memo.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            # Identical texts within a batch are only classified once
+            unique = list(dict.fromkeys(texts[i] for i in missing))
+            computed = dict(zip(unique, self.classify_batch(unique, top_n)))
+            for i in missing:
+                results[i] = list(computed[texts[i]])
+                self.memo.set(keys[i], results[i])
+        return [(category, tags) for category, tags in results]
+
+    def classify_batch(self, texts, top_n=5):
+        """Classify and tag many texts with one transform and one predict call"""
+        # Same normalization as the training data, so both see identical tokens
+        text_matrix = self.tfidf.transform(normalize_batch(texts))
+        categories = [str(category) for category in self.le.inverse_transform(self.model.predict(text_matrix))]
+        return list(zip(categories, self.generate_tags_batch(text_matrix, top_n)))
+
     def generate_tags(self, text, top_n=5):
         """Generate tags using TF-IDF features"""
         try:
-            text_vector = self.tfidf.transform([text])
-            feature_indices = text_vector.nonzero()[1]
-            tfidf_scores = zip(feature_indices, [text_vector[0, x] for x in feature_indices])
-            
-            sorted_items = sorted(tfidf_scores, key=lambda x: x[1], reverse=True)
-            candidates = [(self.tfidf.get_feature_names_out()[i], score) 
-                         for i, score in sorted_items[:top_n*2]]
-            
+            return self.generate_tags_batch(self.tfidf.transform([normalize_text(text)]), top_n)[0]
+        except Exception as e:
+            app.logger.error(f"Tag generation error: {str(e)}")
+            return []
+
+    def generate_tags_batch(self, text_matrix, top_n=5):
+        """Generate tags for every row of a TF-IDF matrix, working on the raw CSR arrays"""
+        text_matrix = text_matrix.tocsr()
+        n_candidates = top_n * 2
+        all_tags = []
+        for row in range(text_matrix.shape[0]):
+            start, end = text_matrix.indptr[row], text_matrix.indptr[row + 1]
+            scores = text_matrix.data[start:end]
+            features = text_matrix.indices[start:end]
+
+            # Keep the top candidates; ties at the cut-off go to the earliest entries
+            if len(scores) > n_candidates:
+                kth = len(scores) - n_candidates
+                threshold = scores[np.argpartition(scores, kth)[kth]]
+                above = np.flatnonzero(scores > threshold)
+                ties = np.flatnonzero(scores == threshold)[:n_candidates - len(above)]
+                positions = np.concatenate([above, ties])
+            else:
+                positions = np.flatnonzero(scores)
+            # Highest score first, equal scores in storage order (a stable sort)
+            positions = positions[np.lexsort((positions, -scores[positions]))]
+            candidates = features[positions]
+            candidates = candidates[self.tag_mask[candidates]]
+
             unique_tags = []
             seen_words = set()
-            for tag, score in candidates:
-                words = [word for word in tag.split() 
-                        if word not in custom_stop_words and len(word) > 2]
-                simple_tag = ' '.join(words)
-                
-                if simple_tag and not any(word in seen_words for word in simple_tag.split()):
-                    unique_tags.append(simple_tag)
-                    seen_words.update(simple_tag.split())
-                
+            for feature in candidates:
+                words = self.feature_words[feature]
+                if not any(word in seen_words for word in words):
+                    unique_tags.append(self.feature_tags[feature])
+                    seen_words.update(words)
+
                 if len(unique_tags) >= top_n:
                     break
-                    
-            return unique_tags[:top_n]
-        except Exception as e:
-            app.logger.error(f"Tag generation error: {str(e)}")
-            return []
 
-# Text cleaning functions
-def remove_emojis(text):
-    emoji_pattern = re.compile("["
-                               u"\U0001F600-\U0001F64F"  # emoticons
-                               u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                               u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                               u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                               u"\U00002500-\U00002BEF"  # chinese characters
-                               u"\U00002702-\U000027B0"
-                               u"\U00002702-\U000027B0"
-                               u"\U000024C2-\U0001F251"
-                               "]+", flags=re.UNICODE)
-    return emoji_pattern.sub(r'', text)
-
-def remove_links(text):
-    url_pattern = re.compile(r'https?://\S+|www\.\S+')
-    return url_pattern.sub(r'', text)
-
-def clean_text(text):
-    if not text:
-        return ''
-    text = remove_emojis(text)
-    text = remove_links(text)
-    text = re.sub(r'[^\w\s]', ' ', text)  # Remove special characters
-    text = re.sub(r'\s+', ' ', text).strip()  # Remove extra whitespace
-    return text.lower()
+            all_tags.append(unique_tags)
+        return all_tags
 
 def get_site_name(url):
     """Extract website name from URL"""
@@ -252,80 +375,142 @@ def get_site_name(url):
         netloc = netloc[4:]
     return netloc.split(':')[0]  # Remove port number if present
 
-def get_favicon_url(url, soup=None):
+def canonical_url(url):
+    """Normalize a URL so trivially different links share one cache entry"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower() or 'http'
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = parsed.path.rstrip('/') or '/'
+    query = sorted((key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                   if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS)
+    return urlunparse((scheme, netloc, path, '', urlencode(query), ''))
+
+def has_default_favicon(url):
+    """Probe the default /favicon.ico location"""
+    parsed = urlparse(url)
+    try:
+        response = http_client.head(f"{parsed.scheme}://{parsed.netloc}/favicon.ico", timeout=2)
+        return response.status_code == 200
+    except Exception:
+        return False
+
+def get_favicon_url(url, icon_href=None, default_found=None):
     """Get website's favicon URL"""
     parsed = urlparse(url)
     base_url = f"{parsed.scheme}://{parsed.netloc}"
     
     # Check default favicon location
     default_icon = f"{base_url}/favicon.ico"
-    try:
-        response = requests.head(default_icon, timeout=2)
-        if response.status_code == 200:
-            return default_icon
-    except:
-        pass
+    if default_found is None:
+        default_found = has_default_favicon(url)
+    if default_found:
+        return default_icon
     
-    # Search HTML for icon links if soup is available
-    if soup:
-        icon_link = soup.find('link', rel=lambda x: x and x.lower() in ['icon', 'shortcut icon'])
-        if icon_link:
-            icon_path = icon_link.get('href', '')
-            if icon_path.startswith(('http://', 'https://')):
-                return icon_path
-            else:
-                return f"{base_url}/{icon_path.lstrip('/')}"
+    # Fall back to the icon link found in the HTML
+    if icon_href:
+        if icon_href.startswith(('http://', 'https://')):
+            return icon_href
+        else:
+            return f"{base_url}/{icon_href.lstrip('/')}"
     
     return default_icon
 
 # Load model during app initialization
+def warm_up_predictor(predictor):
+    """Exercise a freshly loaded model before it serves traffic"""
+    predictor.classify_batch(WARMUP_TEXTS)
+
+model_registry = ModelRegistry(MODEL_REGISTRY_PATH, functools.partial(CategoryPredictor, memo=prediction_cache),
+                               legacy_dir=APP_DIR, warmup=warm_up_predictor)
+
 def create_app():
-    global predictor
-    predictor = CategoryPredictor()
+    model_registry.load()
     return app
 
 def get_visible_text(url):
+    cache_key = canonical_url(url)
+    text_data = content_cache.get(cache_key)
+    if text_data:
+        return text_data
+
+    text_data = fetch_visible_text(url)
+    if text_data:
+        content_cache.set(cache_key, text_data)
+    return text_data
+
+def get_visible_text_many(urls):
+    """Extract many URLs concurrently, serving repeats from the content cache"""
+    results = [content_cache.get(canonical_url(url)) for url in urls]
+    missing = [i for i, text_data in enumerate(results) if not text_data]
+    if missing:
+        fetched = asyncio.run(extract_many([urls[i] for i in missing]))
+        for i, text_data in zip(missing, fetched):
+            if text_data:
+                content_cache.set(canonical_url(urls[i]), text_data)
+            results[i] = text_data
+    return results
+
+def fetch_visible_text(url):
+    return asyncio.run(extract_content(url))
+
+async def extract_many(urls):
+    return await asyncio.gather(*(extract_content(url) for url in urls))
+
+async def extract_content(url):
+    """Fetch and extract a URL while probing its favicon concurrently"""
     if is_youtube(url):
-        return handle_youtube(url)
+        handler = handle_youtube
     elif is_reddit(url):
-        return handle_reddit(url)
+        handler = handle_reddit
     elif is_twitter(url):  # Added Twitter support
-        return handle_twitter(url)
-    
+        handler = handle_twitter
+    else:
+        handler = scrape_page
+
+    # Only probe /favicon.ico for sites we have not resolved recently
+    site_name = get_site_name(url)
+    cached_icon = favicon_store.lookup(site_name)
+    if cached_icon:
+        text_data = await http_client.run_for_host(url, handler, url)
+        default_found = cached_icon['default_found']
+    else:
+        text_data, default_found = await asyncio.gather(
+            http_client.run_for_host(url, handler, url),
+            http_client.run_for_host(url, has_default_favicon, url)
+        )
+    if not text_data:
+        return None
+    icon_href = text_data.pop('icon_href', None)
+    text_data['favicon_url'] = get_favicon_url(url, icon_href, default_found)
+    if not cached_icon:
+        icon_url = text_data['favicon_url'] if default_found or icon_href else None
+        favicon_store.record(site_name, icon_url, default_found)
+    return text_data
+
+def scrape_page(url):
+    """Scrape a generic web page"""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        parser = VisibleTextParser()
+        started = time.monotonic()
+        with http_client.stream(url, timeout=http_client.page_timeout()) as response:
+            response.raise_for_status()
+            complete = True
+            for chunk in http_client.iter_html(response, started=started):
+                parser.feed(chunk)
+                # Stop downloading once there is enough text to classify
+                if parser.text_length >= SCRAPE_TEXT_LIMIT:
+                    complete = False
+                    break
+        if complete:
+            parser.close()
+        page = parser.page()
         
         # Get site info
         site_name = get_site_name(url)
-        favicon_url = get_favicon_url(url, soup)
-        
-        # Extract title (heading)
-        title = soup.title.string.strip() if soup.title else 'No Title Found'
-        
-        # Remove unwanted tags
-        for element in soup(['script', 'style', 'meta', 'link', 'nav', 'footer', 
-                             'header', 'aside', 'form', 'button', 'a', 'noscript']):
-            element.decompose()
-
-        # Text extraction logic
-        def tag_visible(element):
-            if element.parent.name in ['[document]', 'body', 'div', 'p', 'article', 
-                                       'main', 'section', 'span', 'h1', 'h2', 'h3', 
-                                       'h4', 'h5', 'h6']:
-                if isinstance(element, Comment):
-                    return False
-                return True
-            return False
-
-        texts = soup.findAll(text=True)
-        visible_texts = filter(tag_visible, texts)
-        
-        raw_text = ' '.join(t.strip() for t in visible_texts if t.strip())
-        raw_text = ' '.join(raw_text.split())
+        title = page['title']
+        raw_text = page['text']
         
         # Remove any remaining "html" or similar artifacts
         cleaned_text = re.sub(r'\bhtml\b', '', raw_text, flags=re.IGNORECASE).strip()
@@ -334,20 +519,48 @@ def get_visible_text(url):
             'title': title,
             'text': clean_text(cleaned_text),
             'site_name': site_name,
-            'favicon_url': favicon_url
+            'icon_href': page['icon_href']
         }
     except Exception as e:
         app.logger.error(f"Scraping error: {str(e)}")
         return None
 
+def build_prediction(url, text_data, category, tags):
+    """Shape a prediction response for a single URL"""
+    return {
+        'url': url,
+        'category': category,
+        'tags': tags,
+        'site_name': text_data['site_name'],
+        'favicon_url': text_data['favicon_url'],
+        'title': text_data['title'],
+        'content': text_data['text'][:500] + '...' if len(text_data['text']) > 500 else text_data['text'],
+        'status': 'success'
+    }
+
+def predict_many(urls):
+    """Extract and classify many URLs, returning a prediction or None for each"""
+    extracted = get_visible_text_many(urls)
+    fetched = [i for i, text_data in enumerate(extracted) if text_data]
+    results = [None] * len(urls)
+    predictions = model_registry.current().predict_batch([extracted[i]['text'] for i in fetched])
+    for i, (category, tags) in zip(fetched, predictions):
+        results[i] = build_prediction(urls[i], extracted[i], category, tags)
+    return results
+
+def is_valid_url(url):
+    return isinstance(url, str) and bool(url.strip())
+
 @app.route('/predict', methods=['POST'])
 def predict_category():
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data or 'url' not in data:
+    if not isinstance(data, dict) or 'url' not in data:
         return jsonify({'error': 'Missing URL parameter'}), 400
     
     url = data['url']
+    if not is_valid_url(url):
+        return jsonify({'error': 'URL must be a non-empty string'}), 400
     
     # Get data based on URL type
     text_data = get_visible_text(url)
@@ -356,23 +569,164 @@ def predict_category():
     
     # Predict and generate tags
     try:
-        category = predictor.predict(text_data['text'])
-        tags = predictor.generate_tags(text_data['text'])
+        category, tags = model_registry.current().predict_batch([text_data['text']])[0]
         
-        return jsonify({
-            'url': url,
-            'category': category,
-            'tags': tags,
-            'site_name': text_data['site_name'],
-            'favicon_url': text_data['favicon_url'],
-            'title': text_data['title'],
-            'content': text_data['text'][:500] + '...' if len(text_data['text']) > 500 else text_data['text'],
-            'status': 'success'
-        })
+        return jsonify(build_prediction(url, text_data, category, tags))
     except Exception as e:
         app.logger.error(f"Prediction error: {str(e)}")
         return jsonify({'error': 'Prediction failed', 'url': url}), 500
 
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get('urls'), list):
+        return jsonify({'error': 'Missing urls parameter'}), 400
+
+    urls = data['urls']
+    if len(urls) > MAX_BATCH_SIZE:
+        return jsonify({'error': f'Too many URLs (max {MAX_BATCH_SIZE})'}), 400
+
+    # Fetch every valid page concurrently, keeping results in request order
+    valid = [i for i, url in enumerate(urls) if is_valid_url(url)]
+    extracted = [None] * len(urls)
+    for i, text_data in zip(valid, get_visible_text_many([urls[i] for i in valid])):
+        extracted[i] = text_data
+
+    results = [{'url': url, 'error': 'Failed to extract data from URL', 'status': 'error'}
+               for url in urls]
+    for i in set(range(len(urls))) - set(valid):
+        results[i]['error'] = 'URL must be a non-empty string'
+    fetched = [i for i, text_data in enumerate(extracted) if text_data]
+
+    # Classify the whole batch with a single vectorizer and model pass
+    try:
+        predictions = model_registry.current().predict_batch([extracted[i]['text'] for i in fetched])
+        for i, (category, tags) in zip(fetched, predictions):
+            results[i] = build_prediction(urls[i], extracted[i], category, tags)
+    except Exception as e:
+        app.logger.error(f"Batch prediction error: {str(e)}")
+        for i in fetched:
+            results[i] = {'url': urls[i], 'error': 'Prediction failed', 'status': 'error'}
+
+    return jsonify({'results': results, 'status': 'success'})
+
+@app.route('/favicon/<path:site>', methods=['GET'])
+def serve_favicon(site):
+    """Serve a site's favicon from the local store, downloading it on first use"""
+    stored = favicon_store.load_blob(site)
+    if not stored:
+        icon_url = None
+        if not favicon_store.recently_failed(site):
+            # Bookmarks saved before this server resolved the site still carry their own icon URL
+            icon_url = favicon_store.recorded_icon_url(site) or seed_favicon(site)
+        stored = download_favicon(icon_url) if icon_url else None
+        if not stored:
+            favicon_store.mark_failed(site)
+            return redirect(url_for('static', filename='images/Icon.png'))
+        favicon_store.save_blob(site, *stored)
+
+    content, content_type = stored
+    response = Response(content, mimetype=content_type)
+    response.headers['Cache-Control'] = f'public, max-age={FAVICON_MAX_AGE}, immutable'
+    return response
+
+def seed_favicon(site):
+    """Seed the favicon store from the newest favicon_url saved for a site"""
+    try:
+        with db_pool.connection() as connection, connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT favicon_url FROM content_details
+                WHERE site_name = %s AND favicon_url LIKE 'http%%'
+                ORDER BY id DESC
+                LIMIT 1
+            """, (site,))
+            row = cursor.fetchone()
+    except Exception as e:
+        app.logger.error(f"Favicon seed error: {str(e)}")
+        return None
+    if not row:
+        return None
+    favicon_store.seed(site, row['favicon_url'])
+    return row['favicon_url']
+
+def download_favicon(icon_url):
+    """Fetch icon bytes from a public host, rejecting non-images and oversized responses"""
+    try:
+        with http_client.get_public(icon_url, timeout=3, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if not content_type.startswith('image/'):
+                return None
+            content = response.raw.read(MAX_ICON_BYTES + 1, decode_content=True)
+        if not content or len(content) > MAX_ICON_BYTES:
+            return None
+        return content, content_type
+    except Exception as e:
+        app.logger.error(f"Favicon download error: {str(e)}")
+        return None
+
+@app.route('/admin/stats', methods=['GET'])
+def admin_stats():
+    return jsonify({
+        'content_cache': content_cache.stats(),
+        'prediction_cache': prediction_cache.stats(),
+        'db_pool': db_pool.stats(),
+        'query_cache': query_cache.stats()
+    })
+
+@app.route('/admin/model', methods=['GET', 'POST'])
+def admin_model():
+    """Report the active model, or load a version (default: the one named in ACTIVE)"""
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        version = data.get('version')
+        master_pid = app.config.get('PREFORK_MASTER_PID')
+        if master_pid:
+            # Workers share the master's model, so the master reloads and re-forks them
+            try:
+                if version:
+                    model_registry.select(version)
+            except LookupError as e:
+                return jsonify({'error': str(e), 'status': 'error'}), 404
+            os.kill(master_pid, signal.SIGHUP)
+            return jsonify({'model': model_registry.status(), 'status': 'reloading'}), 202
+        try:
+            if version:
+                model_registry.activate(version)
+            else:
+                model_registry.load()
+        except LookupError as e:
+            return jsonify({'error': str(e), 'status': 'error'}), 404
+        except Exception as e:
+            app.logger.error(f"Model reload error: {str(e)}")
+            return jsonify({'error': 'Model reload failed', 'status': 'error'}), 500
+    return jsonify({'model': model_registry.status(), 'status': 'success'})
+
+def split_tags(tags):
+    """Split a comma-separated tag string into a list"""
+    return tags.split(',') if tags else []
+
+def normalize_tags(tags):
+    """Trim tags and drop empty and case-insensitive duplicates"""
+    unique_tags = {}
+    for tag in tags:
+        tag = tag.strip()[:255]
+        if tag:
+            unique_tags.setdefault(tag.lower(), tag)
+    return list(unique_tags.values())
+
+def write_bookmark_tags(cursor, bookmark_id, tags):
+    """Replace a bookmark's rows in the bookmark_tags table"""
+    unique_tags = normalize_tags(tags)
+    cursor.execute("DELETE FROM bookmark_tags WHERE bookmark_id = %s", (bookmark_id,))
+    if unique_tags:
+        # IGNORE: the column's collation also equates tags like "resume" and "résumé"
+        cursor.executemany(
+            "INSERT IGNORE INTO bookmark_tags (bookmark_id, tag) VALUES (%s, %s)",
+            [(bookmark_id, tag) for tag in unique_tags]
+        )
+
 @app.route('/save', methods=['POST'])
 def save_content():
     data = request.get_json()
@@ -380,15 +734,7 @@ def save_content():
         return jsonify({'error': 'Missing data'}), 400
 
     try:
-        # Connect to the database
-        connection = pymysql.connect(
-            host='localhost',
-            user='root',
-            database='aibookmarkerdb',
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with connection.cursor() as cursor:
+        with db_pool.connection() as connection, connection.cursor() as cursor:
             # Check if the link already exists
             sql_check = "SELECT id FROM content_details WHERE url = %s"
             cursor.execute(sql_check, (data['url'],))
@@ -411,14 +757,162 @@ def save_content():
                 data.get('content'),
                 data.get('favicon_url')
             ))
+            write_bookmark_tags(cursor, cursor.lastrowid, data.get('tags', []))
             connection.commit()
+        query_cache.invalidate('content_details', 'bookmark_tags')
 
         return jsonify({'message': 'Content saved successfully', 'status': 'success'}), 201
     except Exception as e:
         app.logger.error(f"Database save error: {str(e)}")
         return jsonify({'error': 'Failed to save content'}), 500
+
+def process_bookmark_job(job):
+    """Fetch, classify and fill in a bookmark saved through /enqueue"""
+    text_data = get_visible_text(job['url'])
+    if not text_data:
+        raise ValueError('Failed to extract data from URL')
+    category, tags = model_registry.current().predict_batch([text_data['text']])[0]
+    result = build_prediction(job['url'], text_data, category, tags)
+
+    with db_pool.connection() as connection, connection.cursor() as cursor:
+        cursor.execute("""
+            UPDATE content_details
+            SET title = %s, site_name = %s, category = %s, tags = %s, content = %s, favicon_url = %s
+            WHERE id = %s
+        """, (
+            result['title'],
+            result['site_name'],
+            result['category'],
+            ','.join(result['tags']),
+            result['content'],
+            result['favicon_url'],
+            job['bookmark_id']
+        ))
+        write_bookmark_tags(cursor, job['bookmark_id'], result['tags'])
+        job_queue.complete(cursor, job['id'])
+        connection.commit()
+    query_cache.invalidate('content_details', 'bookmark_tags')
+
+job_queue = JobQueue(db_pool, max_attempts=int(os.getenv('JOB_MAX_ATTEMPTS', 3)))
+job_workers = JobWorkers(job_queue, process_bookmark_job,
+                         threads=int(os.getenv('JOB_WORKERS', 2)),
+                         poll_interval=float(os.getenv('JOB_POLL_INTERVAL', 5)),
+                         logger=app.logger)
+
+@app.before_request
+def start_job_workers():
+    job_workers.ensure_started()
+
+@app.route('/enqueue', methods=['POST'])
+def enqueue_content():
+    """Save a link immediately and classify it in the background"""
+    data = request.get_json()
+    if not data or 'url' not in data:
+        return jsonify({'error': 'Missing data'}), 400
+
+    try:
+        with db_pool.connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT id FROM content_details WHERE url = %s", (data['url'],))
+            existing_link = cursor.fetchone()
+            if existing_link:
+                return jsonify({'message': 'This link already exists in the database.', 'status': 'duplicate'}), 200
+
+            cursor.execute(
+                "INSERT INTO content_details (url, title, site_name) VALUES (%s, %s, %s)",
+                (data['url'], data.get('title'), get_site_name(data['url']))
+            )
+            bookmark_id = cursor.lastrowid
+            job_id = job_queue.enqueue(cursor, bookmark_id, data['url'])
+            connection.commit()
+        query_cache.invalidate('content_details')
+        job_workers.notify()
+
+        return jsonify({
+            'job_id': job_id,
+            'bookmark_id': bookmark_id,
+            'status_url': url_for('job_status', job_id=job_id),
+            'status': 'pending'
+        }), 202
+    except Exception as e:
+        app.logger.error(f"Enqueue error: {str(e)}")
+        return jsonify({'error': 'Failed to save content'}), 500
+
+@app.route('/jobs/<int:job_id>', methods=['GET'])
+def job_status(job_id):
+    try:
+        job = job_queue.get(job_id)
+    except Exception as e:
+        app.logger.error(f"Job status error: {str(e)}")
+        return jsonify({'error': 'Failed to load job'}), 500
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    for field in ('created_at', 'updated_at'):
+        if job[field]:
+            job[field] = job[field].isoformat()
+    job['tags'] = split_tags(job['tags'])
+    return jsonify(job)
+
+def run_import(bookmarks, import_id):
+    status_path = os.path.join(IMPORT_PATH, f"{import_id}.status.json")
+
+    def write_status(progress):
+        tmp_path = f"{status_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(progress, f)
+        os.replace(tmp_path, status_path)
+
+    importer = BookmarkImporter(
+        db_pool, predict_many, normalize_tags, get_site_name,
+        chunk_size=IMPORT_CHUNK_SIZE,
+        checkpoint_path=os.path.join(IMPORT_PATH, f"{import_id}.checkpoint.json"),
+        on_progress=write_status
+    )
+    try:
+        importer.run(bookmarks)
+    except Exception as e:
+        app.logger.error(f"Import {import_id} error: {str(e)}")
     finally:
-        connection.close()
+        import_guard.release(import_id)
+        query_cache.invalidate('content_details', 'bookmark_tags')
+
+@app.route('/import', methods=['POST'])
+def import_bookmarks():
+    """Start importing an uploaded bookmarks export; uploading the same file again resumes it"""
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify({'error': 'Missing file'}), 400
+
+    content = upload.read()
+    try:
+        bookmarks = parse_bookmarks(upload.filename, content.decode('utf-8', errors='replace'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if not bookmarks:
+        return jsonify({'error': 'No bookmarks found in file'}), 400
+
+    import_id = hashlib.sha1(content).hexdigest()[:16]
+    os.makedirs(IMPORT_PATH, exist_ok=True)
+    # A second thread on the same checkpoint would insert every bookmark twice
+    started = import_guard.acquire(import_id, os.path.join(IMPORT_PATH, f"{import_id}.lock"))
+    if started:
+        threading.Thread(target=run_import, args=(bookmarks, import_id), daemon=True).start()
+    return jsonify({
+        'import_id': import_id,
+        'bookmarks': len(bookmarks),
+        'status_url': url_for('import_status', import_id=import_id),
+        'status': 'running' if started else 'already running'
+    }), 202
+
+@app.route('/import/<import_id>', methods=['GET'])
+def import_status(import_id):
+    if not re.fullmatch(r'[0-9a-f]{16}', import_id):
+        return jsonify({'error': 'Import not found'}), 404
+    try:
+        with open(os.path.join(IMPORT_PATH, f"{import_id}.status.json"), 'r') as f:
+            return jsonify(json.load(f))
+    except FileNotFoundError:
+        return jsonify({'error': 'Import not found'}), 404
 
 @app.route('/delete', methods=['POST'])
 def delete_link():
@@ -427,23 +921,17 @@ def delete_link():
         return jsonify({'error': 'Missing link ID'}), 400
 
     try:
-        connection = pymysql.connect(
-            host='localhost',
-            user='root',
-            database='aibookmarkerdb',
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with connection.cursor() as cursor:
+        with db_pool.connection() as connection, connection.cursor() as cursor:
+            cursor.execute("DELETE FROM bookmark_tags WHERE bookmark_id = %s", (link_id,))
             sql = "DELETE FROM content_details WHERE id = %s"
-            cursor.execute(sql, (link_id,))
+            deleted = cursor.execute(sql, (link_id,))
             connection.commit()
+        if deleted:
+            query_cache.invalidate('content_details', 'bookmark_tags')
         return redirect(url_for('explore'))
     except Exception as e:
         app.logger.error(f"Delete error: {str(e)}")
         return jsonify({'error': 'Failed to delete link'}), 500
-    finally:
-        connection.close()
 
 @app.route('/update', methods=['GET', 'POST'])
 def update_link():
@@ -453,14 +941,7 @@ def update_link():
             return jsonify({'error': 'Missing link ID'}), 400
 
         try:
-            connection = pymysql.connect(
-                host='localhost',
-                user='root',
-                database='aibookmarkerdb',
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            with connection.cursor() as cursor:
+            with db_pool.connection() as connection, connection.cursor() as cursor:
                 sql = "SELECT * FROM content_details WHERE id = %s"
                 cursor.execute(sql, (link_id,))
                 link = cursor.fetchone()
@@ -468,8 +949,6 @@ def update_link():
         except Exception as e:
             app.logger.error(f"Update fetch error: {str(e)}")
             return jsonify({'error': 'Failed to fetch link'}), 500
-        finally:
-            connection.close()
 
     elif request.method == 'POST':
         link_id = request.form.get('link_id')
@@ -480,27 +959,23 @@ def update_link():
             return jsonify({'error': 'Missing required fields'}), 400
 
         try:
-            connection = pymysql.connect(
-                host='localhost',
-                user='root',
-                database='aibookmarkerdb',
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            with connection.cursor() as cursor:
+            with db_pool.connection() as connection, connection.cursor() as cursor:
                 sql = """
                     UPDATE content_details
                     SET title = %s, category = %s, tags = %s
                     WHERE id = %s
                 """
-                cursor.execute(sql, (title, category, tags, link_id))
+                updated = cursor.execute(sql, (title, category, tags, link_id))
+                # Nothing matched (or nothing changed), so there are no tag rows to rewrite
+                if updated:
+                    write_bookmark_tags(cursor, link_id, split_tags(tags))
                 connection.commit()
+            if updated:
+                query_cache.invalidate('content_details', 'bookmark_tags')
             return redirect(url_for('view_details', link_id=link_id))  # Redirect to details page
         except Exception as e:
             app.logger.error(f"Update error: {str(e)}")
             return jsonify({'error': 'Failed to update link'}), 500
-        finally:
-            connection.close()
 
 @app.route('/details', methods=['GET'])
 def view_details():
@@ -509,14 +984,7 @@ def view_details():
         return jsonify({'error': 'Missing link ID'}), 400
 
     try:
-        connection = pymysql.connect(
-            host='localhost',
-            user='root',
-            database='aibookmarkerdb',
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with connection.cursor() as cursor:
+        with db_pool.connection() as connection, connection.cursor() as cursor:
             sql = "SELECT * FROM content_details WHERE id = %s"
             cursor.execute(sql, (link_id,))
             link = cursor.fetchone()
@@ -524,117 +992,214 @@ def view_details():
     except Exception as e:
         app.logger.error(f"Details fetch error: {str(e)}")
         return jsonify({'error': 'Failed to fetch link details'}), 500
-    finally:
-        connection.close()
+
+def load_dashboard():
+    with db_pool.connection() as connection, connection.cursor() as cursor:
+        # Fetch all categories with their link counts (including 0 links)
+        all_categories = [
+            "Entertainment & Media", "Science & Learning", "News & Politics",
+            "Howto & Style", "Sports", "Autos & Vehicles",
+            "Lifestyle & Pets", "Travel & Adventures"
+        ]
+        sql = """
+            SELECT category, COUNT(*) as link_count
+            FROM content_details
+            GROUP BY category
+        """
+        cursor.execute(sql)
+        category_counts = cursor.fetchall()
+        category_data = {cat['category']: cat['link_count'] for cat in category_counts}
+        categories = [{'category': cat, 'link_count': category_data.get(cat, 0)} for cat in all_categories]
+
+        # Fetch top 5 websites with favicon_url
+        sql = """
+            SELECT site_name, favicon_url, COUNT(*) as site_count
+            FROM content_details
+            GROUP BY site_name, favicon_url
+            ORDER BY site_count DESC
+            LIMIT 5
+        """
+        cursor.execute(sql)
+        top_websites = cursor.fetchall()
+
+        # Fetch top 5 tags
+        sql = """
+            SELECT tag, COUNT(*) as tag_count
+            FROM bookmark_tags
+            GROUP BY tag
+            ORDER BY tag_count DESC
+            LIMIT 5
+        """
+        cursor.execute(sql)
+        top_tags = cursor.fetchall()
+
+    return {'categories': categories, 'top_websites': top_websites, 'top_tags': top_tags}
 
 @app.route('/')
 def dashboard():
     try:
-        # Connect to the database
-        connection = pymysql.connect(
-            host='localhost',
-            user='root',
-            database='aibookmarkerdb',
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with connection.cursor() as cursor:
-            # Fetch all categories with their link counts (including 0 links)
-            all_categories = [
-                "Entertainment & Media", "Science & Learning", "News & Politics",
-                "Howto & Style", "Sports", "Autos & Vehicles",
-                "Lifestyle & Pets", "Travel & Adventures"
-            ]
-            sql = """
-                SELECT category, COUNT(*) as link_count
-                FROM content_details
-                GROUP BY category
-            """
-            cursor.execute(sql)
-            category_counts = cursor.fetchall()
-            category_data = {cat['category']: cat['link_count'] for cat in category_counts}
-            categories = [{'category': cat, 'link_count': category_data.get(cat, 0)} for cat in all_categories]
-
-            # Fetch top 5 websites with favicon_url
-            sql = """
-                SELECT site_name, favicon_url, COUNT(*) as site_count
-                FROM content_details
-                GROUP BY site_name, favicon_url
-                ORDER BY site_count DESC
-                LIMIT 5
-            """
-            cursor.execute(sql)
-            top_websites = cursor.fetchall()
-
-            # Fetch top 5 tags
-            sql = """
-                SELECT tag, COUNT(*) as tag_count
-                FROM (
-                    SELECT TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(tags, ',', n.n), ',', -1)) AS tag
-                    FROM content_details
-                    CROSS JOIN (
-                        SELECT a.N + b.N * 10 + 1 AS n
-                        FROM (SELECT 0 AS N UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9) a
-                        CROSS JOIN (SELECT 0 AS N UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9) b
-                    ) n
-                    WHERE n.n <= 1 + (LENGTH(tags) - LENGTH(REPLACE(tags, ',', ''))))
-                AS tag_table
-                WHERE tag != ''
-                GROUP BY tag
-                ORDER BY tag_count DESC
-                LIMIT 5
-            """
-            cursor.execute(sql)
-            top_tags = cursor.fetchall()
-
-        return render_template('dashboard.html', categories=categories, top_websites=top_websites, top_tags=top_tags)
+        data = query_cache.get_or_load('dashboard', (), ('content_details', 'bookmark_tags'), load_dashboard)
+        return render_template('dashboard.html', **data)
     except Exception as e:
         app.logger.error(f"Dashboard error: {str(e)}")
         return render_template('dashboard.html', categories=[], top_websites=[], top_tags=[])
-    finally:
-        connection.close()
 
 @app.route('/add')
 def add_page():
     return render_template('index.html')
 
-@app.route('/explore', methods=['GET'])
-def explore():
-    category_filter = request.args.get('category', None)
-    search_query = request.args.get('search', None)
+# Search over the ft_content_search FULLTEXT index (see TAGwise Database/migrations)
+SEARCH_MATCH = "MATCH(title, tags, site_name, content) AGAINST (%s IN BOOLEAN MODE)"
+# MATCH() is a float; a fixed-point copy is what the cursor stores, so the
+# value sent back compares exactly equal to the row it came from
+SEARCH_RELEVANCE = f"CAST({SEARCH_MATCH} AS DECIMAL(20, 6))"
+FULLTEXT_MIN_TOKEN = 3  # InnoDB's innodb_ft_min_token_size default
+
+def build_fulltext_query(search_query):
+    """Turn free text into a boolean-mode query requiring every word as a prefix"""
+    terms = [term for term in re.findall(r'\w+', search_query.lower()) if len(term) >= FULLTEXT_MIN_TOKEN]
+    return ' '.join(f'+{term}*' for term in terms)
+
+EXPLORE_PAGE_SIZE = 30
+EXPLORE_MAX_PAGE_SIZE = 100
+EXPLORE_COLUMNS = "id, favicon_url, title, category, site_name, url, tags, created_at"
 
+def encode_cursor(sort_value, link_id):
+    """Encode the sort key of the last row on a page as an opaque token"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    elif isinstance(sort_value, Decimal):
+        sort_value = str(sort_value)
+    payload = json.dumps([sort_value, link_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii')
+
+def decode_cursor(cursor, by_relevance):
+    sort_value, link_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    if by_relevance:
+        try:
+            relevance = Decimal(sort_value)
+            if relevance.is_finite():
+                return relevance, int(link_id)
+        except (InvalidOperation, TypeError):
+            pass
+        raise ValueError(f"Invalid relevance in cursor: {sort_value!r}")
+    return datetime.fromisoformat(sort_value), int(link_id)
+
+def parse_page_size(value):
     try:
-        # Connect to the database
-        connection = pymysql.connect(
-            host='localhost',
-            user='root',
-            database='aibookmarkerdb',
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with connection.cursor() as cursor:
-            sql = "SELECT id, favicon_url, title, category, site_name, url, tags FROM content_details WHERE 1=1"
+        return max(1, min(int(value), EXPLORE_MAX_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return EXPLORE_PAGE_SIZE
+
+def load_explore_links(category_filter, search_query, tag_filter, cursor=None, page_size=EXPLORE_PAGE_SIZE,
+                       site_filter=None):
+    """Fetch one page of links in keyset order, returning (links, next_cursor)"""
+    fulltext_query = build_fulltext_query(search_query) if search_query else None
+    with db_pool.connection() as connection, connection.cursor() as db_cursor:
+        if fulltext_query:
+            sql = f"SELECT {EXPLORE_COLUMNS}, {SEARCH_RELEVANCE} AS relevance FROM content_details WHERE {SEARCH_MATCH}"
+            params = [fulltext_query, fulltext_query]
+        else:
+            sql = f"SELECT {EXPLORE_COLUMNS} FROM content_details WHERE 1=1"
             params = []
 
-            if category_filter:
-                sql += " AND category = %s"
-                params.append(category_filter)
+        if category_filter:
+            sql += " AND category = %s"
+            params.append(category_filter)
+
+        if tag_filter:
+            sql += " AND id IN (SELECT bookmark_id FROM bookmark_tags WHERE tag = %s)"
+            params.append(tag_filter)
+
+        if site_filter:
+            sql += " AND site_name = %s"
+            params.append(site_filter)
+
+        if search_query and not fulltext_query:
+            # Only words too short for the FULLTEXT index, fall back to a substring match
+            sql += " AND (tags LIKE %s OR site_name LIKE %s)"
+            params.extend([f"%{search_query}%", f"%{search_query}%"])
+
+        # Continue strictly after the last row of the previous page
+        if cursor:
+            sort_value, last_id = cursor
+            sort_column = SEARCH_RELEVANCE if fulltext_query else "created_at"
+            sql += f" AND ({sort_column} < %s OR ({sort_column} = %s AND id < %s))"
+            if fulltext_query:
+                params.extend([fulltext_query, sort_value, fulltext_query, sort_value, last_id])
+            else:
+                params.extend([sort_value, sort_value, last_id])
+
+        if fulltext_query:
+            sql += " ORDER BY relevance DESC, id DESC"
+        else:
+            sql += " ORDER BY created_at DESC, id DESC"
+        sql += " LIMIT %s"
+        params.append(page_size + 1)
+
+        db_cursor.execute(sql, params)
+        links = db_cursor.fetchall()
+
+    next_cursor = None
+    if len(links) > page_size:
+        links = links[:page_size]
+        last = links[-1]
+        next_cursor = encode_cursor(last['relevance'] if fulltext_query else last['created_at'], last['id'])
+    return links, next_cursor
+
+def explore_page(args):
+    """Load the explore page selected by the request arguments"""
+    category_filter = args.get('category') or None
+    search_query = args.get('search') or None
+    tag_filter = args.get('tag') or None
+    site_filter = args.get('site') or None
+    page_size = parse_page_size(args.get('limit'))
+    cursor_token = args.get('cursor') or None
+    by_relevance = bool(search_query and build_fulltext_query(search_query))
+    cursor = decode_cursor(cursor_token, by_relevance) if cursor_token else None
 
-            if search_query:
-                sql += " AND (tags LIKE %s OR site_name LIKE %s)"
-                params.extend([f"%{search_query}%", f"%{search_query}%"])
+    return query_cache.get_or_load(
+        'explore', (category_filter, search_query, tag_filter, site_filter, cursor_token, page_size),
+        ('content_details', 'bookmark_tags') if tag_filter else ('content_details',),
+        lambda: load_explore_links(category_filter, search_query, tag_filter, cursor, page_size, site_filter)
+    )
 
-            cursor.execute(sql, params)
-            links = cursor.fetchall()
+@app.route('/explore', methods=['GET'])
+def explore():
+    category_filter = request.args.get('category', None)
+    search_query = request.args.get('search', None)
+    tag_filter = request.args.get('tag', None)
+    site_filter = request.args.get('site', None)
+    page_limit = request.args.get('limit', None)
+
+    try:
+        links, next_cursor = explore_page(request.args)
 
         # Render the explore page without the analyze button
-        return render_template('explore.html', links=links, category_filter=category_filter, search_query=search_query)
+        return render_template('explore.html', links=links, next_cursor=next_cursor, category_filter=category_filter, search_query=search_query, tag_filter=tag_filter, site_filter=site_filter, page_limit=page_limit)
     except Exception as e:
         app.logger.error(f"Explore page error: {str(e)}")
-        return render_template('explore.html', links=[], category_filter=category_filter, search_query=search_query)
-    finally:
-        connection.close()
+        return render_template('explore.html', links=[], next_cursor=None, category_filter=category_filter, search_query=search_query, tag_filter=tag_filter, site_filter=site_filter, page_limit=page_limit)
+
+@app.route('/api/explore', methods=['GET'])
+def explore_json():
+    """JSON variant of /explore for infinite scroll clients"""
+    try:
+        links, next_cursor = explore_page(request.args)
+    except (ValueError, TypeError):
+        return jsonify({'error': 'Invalid cursor'}), 400
+    except Exception as e:
+        app.logger.error(f"Explore API error: {str(e)}")
+        return jsonify({'error': 'Failed to fetch links'}), 500
+
+    return jsonify({
+        'links': [dict(link, created_at=link['created_at'].isoformat() if link.get('created_at') else None)
+                  for link in links],
+        'next_cursor': next_cursor,
+        'status': 'success'
+    })
 
 if __name__ == '__main__':
     app = create_app()
+    job_workers.ensure_started()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
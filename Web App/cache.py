@@ -0,0 +1,153 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class SQLiteTier:
+    """On-disk cache tier backed by a single SQLite table"""
+
+    # Rows beyond max_rows are pruned oldest-first every PRUNE_EVERY writes
+    PRUNE_EVERY = 1000
+
+    def __init__(self, path, table='cache', max_rows=None):
+        self.path = path
+        self.table = table
+        self.max_rows = max_rows
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        # Connections must not be shared across a fork, so reopen per process
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)'
+            )
+            self._conn.commit()
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key):
+        with self._lock:
+            row = self._connect().execute(
+                f'SELECT value, stored_at FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key, value, stored_at):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                f'REPLACE INTO {self.table} (key, value, stored_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value), stored_at)
+            )
+            self._writes += 1
+            if self.max_rows and self._writes % self.PRUNE_EVERY == 0:
+                conn.execute(
+                    f'DELETE FROM {self.table} WHERE key IN '
+                    f'(SELECT key FROM {self.table} ORDER BY stored_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_rows,)
+                )
+            conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f'DELETE FROM {self.table}')
+            conn.commit()
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and an optional disk tier"""
+
+    def __init__(self, max_entries=1024, ttl=900, disk=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk = disk
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self._entries[key]
+
+        if self.disk:
+            stored = self.disk.get(key)
+            if stored and now - stored[1] < self.ttl:
+                with self._lock:
+                    self._store(key, stored[0], stored[1])
+                    self.disk_hits += 1
+                return stored[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        stored_at = time.time()
+        with self._lock:
+            self._store(key, value, stored_at)
+        if self.disk:
+            self.disk.set(key, value, stored_at)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk:
+            self.disk.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.disk:
+            self.disk.clear()
+
+    def _store(self, key, value, stored_at):
+        self._entries[key] = (value, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0
+            }
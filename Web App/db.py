@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import pymysql
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Thread-safe, size-limited pool of pymysql connections"""
+
+    def __init__(self, max_size=10, timeout=5, ping_interval=30, max_lifetime=3600, **connect_kwargs):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self.max_lifetime = max_lifetime
+        self.connect_kwargs = connect_kwargs
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        # Sockets must never be shared between processes, so a forked child starts empty
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._created = 0
+        self._in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+        self.discarded = 0
+
+    def _open(self):
+        conn = pymysql.connect(**self.connect_kwargs)
+        conn._pool_created_at = time.monotonic()
+        conn._pool_used_at = time.monotonic()
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _discard(self, conn):
+        with self._lock:
+            self.discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn):
+        now = time.monotonic()
+        if now - conn._pool_created_at > self.max_lifetime:
+            return False
+        if now - conn._pool_used_at > self.ping_interval:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def _checkout(self):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.waits += 1
+            if not self._slots.acquire(timeout=self.timeout):
+                with self._lock:
+                    self.timeouts += 1
+                raise PoolTimeout(f"No database connection available after {self.timeout}s")
+        waited = time.monotonic() - started
+
+        try:
+            conn = None
+            while conn is None:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    conn = self._open()
+                    break
+                if not self._is_healthy(conn):
+                    self._discard(conn)
+                    conn = None
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self.checkouts += 1
+            self._in_use += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+        return conn
+
+    def _checkin(self, conn, broken=False):
+        with self._lock:
+            self._in_use -= 1
+        if broken or not conn.open:
+            self._discard(conn)
+        else:
+            conn._pool_used_at = time.monotonic()
+            self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, rolling back anything left uncommitted on return"""
+        conn = self._checkout()
+        broken = False
+        try:
+            yield conn
+        except pymysql.err.OperationalError:
+            broken = True
+            raise
+        finally:
+            if not broken:
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
+            self._checkin(conn, broken)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'created': self._created,
+                'in_use': self._in_use,
+                'idle': self._idle.qsize(),
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'timeouts': self.timeouts,
+                'discarded': self.discarded,
+                'avg_wait_ms': 1000 * self.wait_time / self.checkouts if self.checkouts else 0.0,
+                'max_wait_ms': 1000 * self.max_wait
+            }
+
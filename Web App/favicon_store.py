@@ -0,0 +1,80 @@
+import hashlib
+import os
+import time
+
+from cache import SQLiteTier
+
+# Resolved icons rarely change; failed lookups are retried sooner
+FOUND_TTL = 30 * 24 * 3600
+MISSING_TTL = 24 * 3600
+# Icons that could not be downloaded are not retried before this
+DOWNLOAD_FAILED_TTL = 6 * 3600
+MAX_ICON_BYTES = 256 * 1024
+
+
+class FaviconStore:
+    """Persistent site -> favicon URL index plus a local store of icon bytes"""
+
+    def __init__(self, root):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = SQLiteTier(os.path.join(root, 'index.sqlite3'), table='favicons')
+        self.failures = SQLiteTier(os.path.join(root, 'index.sqlite3'), table='favicon_failures')
+
+    def lookup(self, site):
+        """Return the cached entry for a site, or None when it must be resolved again"""
+        stored = self.index.get(site)
+        if not stored:
+            return None
+        entry, checked_at = stored
+        ttl = FOUND_TTL if entry.get('default_found') else MISSING_TTL
+        if time.time() - checked_at > ttl:
+            return None
+        return entry
+
+    def record(self, site, icon_url, default_found):
+        """Remember how a site's favicon was resolved, including failed probes"""
+        self.index.set(site, {'icon_url': icon_url, 'default_found': default_found}, time.time())
+        # A newly resolved icon URL deserves a fresh download attempt
+        self.failures.delete(site)
+
+    def seed(self, site, icon_url):
+        """Record an icon URL stored with a bookmark, leaving the site due for a fresh probe"""
+        self.index.set(site, {'icon_url': icon_url, 'default_found': None}, 0)
+
+    def recorded_icon_url(self, site):
+        """Return the icon URL recorded for a site, however old, or None"""
+        stored = self.index.get(site)
+        return stored[0].get('icon_url') if stored else None
+
+    def mark_failed(self, site):
+        self.failures.set(site, True, time.time())
+
+    def recently_failed(self, site):
+        stored = self.failures.get(site)
+        return bool(stored) and time.time() - stored[1] < DOWNLOAD_FAILED_TTL
+
+    def _blob_path(self, site):
+        digest = hashlib.sha1(site.encode('utf-8')).hexdigest()
+        return os.path.join(self.blob_dir, digest)
+
+    def load_blob(self, site):
+        """Return (bytes, content_type) for a stored icon, or None"""
+        path = self._blob_path(site)
+        try:
+            with open(path + '.type', 'r') as f:
+                content_type = f.read().strip()
+            with open(path, 'rb') as f:
+                return f.read(), content_type
+        except FileNotFoundError:
+            return None
+
+    def save_blob(self, site, content, content_type):
+        path = self._blob_path(site)
+        # Write to a temp file first so readers never see a partial icon
+        for target, data, mode in ((path, content, 'wb'), (path + '.type', content_type, 'w')):
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, target)
@@ -0,0 +1,172 @@
+from html.parser import HTMLParser
+
+# Elements whose whole subtree is dropped before collecting text
+REMOVED_TAGS = frozenset(['script', 'style', 'meta', 'link', 'nav', 'footer',
+                          'header', 'aside', 'form', 'button', 'a', 'noscript'])
+
+# Text is kept only when its direct parent is one of these
+VISIBLE_PARENTS = frozenset(['[document]', 'body', 'div', 'p', 'article',
+                             'main', 'section', 'span', 'h1', 'h2', 'h3',
+                             'h4', 'h5', 'h6'])
+
+# Void elements never hold content, matching BeautifulSoup's html.parser builder
+VOID_TAGS = frozenset(['area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command',
+                       'embed', 'frame', 'hr', 'image', 'img', 'input', 'isindex',
+                       'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param',
+                       'source', 'spacer', 'track', 'wbr'])
+
+
+class VisibleTextParser(HTMLParser):
+    """Single-pass extractor for a page's title, visible text and icon link
+
+    Follows the tree BeautifulSoup's html.parser builder would build,
+    decomposing REMOVED_TAGS and keeping strings whose parent is in
+    VISIBLE_PARENTS, without materializing it. Markup can be fed in chunks.
+
+    It is not identical. BeautifulSoup parses with convert_charrefs=False,
+    so there an unknown entity loses its ';' ("&foo;" becomes "&foo"), an
+    entity without one stays as typed ("&lt3"), and a reference cut short
+    before a tag ("&#x</p>") turns the rest of the document into literal
+    text. A blank <title> gives 'No Title Found' here, not ''. The pages under
+    tests/fixtures/html pin this behaviour down, differences included.
+    """
+
+    def __init__(self, removed_tags=REMOVED_TAGS):
+        super().__init__(convert_charrefs=True)
+        self.removed_tags = removed_tags
+        self.title = None
+        self.icon_href = None
+        self.texts = []
+        self.text_length = 0
+        self._stack = []
+        self._removed_depth = 0
+        self._pending = []
+        self._in_title = False
+        self._title_parts = []
+        self._title_nodes = []
+        # Void tags opened as <tag>; BeautifulSoup swallows one later </tag> for each
+        self._already_closed = []
+
+    def _flush(self):
+        # Adjacent data chunks form one string node, like BeautifulSoup's endData()
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending = []
+        parent = self._stack[-1] if self._stack else '[document]'
+        if self._removed_depth == 0 and parent in VISIBLE_PARENTS:
+            text = text.strip()
+            if text:
+                self.texts.append(text)
+                self.text_length += len(text) + 1
+
+    def _start(self, tag, attrs):
+        self._flush()
+        if tag == 'link' and self.icon_href is None:
+            rel = dict(attrs).get('rel') or ''
+            if rel.lower() in ('icon', 'shortcut icon') or 'icon' in rel.lower().split():
+                self.icon_href = dict(attrs).get('href') or ''
+        if tag in VOID_TAGS:
+            return
+        self._stack.append(tag)
+        if tag in self.removed_tags:
+            self._removed_depth += 1
+        if tag == 'title' and self.title is None:
+            self._in_title = True
+
+    def _end(self, tag):
+        self._flush()
+        if tag not in self._stack:
+            return
+        # Close everything opened after the matching start tag
+        while self._stack:
+            name = self._stack.pop()
+            if name in self.removed_tags:
+                self._removed_depth -= 1
+            if name == 'title' and self._in_title:
+                self._in_title = False
+                self.title = self._title_string()
+            if name == tag:
+                break
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, attrs)
+        if tag in VOID_TAGS:
+            self._already_closed.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._end(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._already_closed:
+            # A redundant </img> neither closes anything nor ends the current string
+            self._already_closed.remove(tag)
+            return
+        self._end(tag)
+
+    def _title_string(self):
+        # Like soup.title.string, a lone comment or doctype inside <title> is the title
+        if not self._title_parts and len(self._title_nodes) == 1:
+            return self._title_nodes[0].strip()
+        return ''.join(self._title_parts).strip()
+
+    def _special(self, text):
+        """A comment, doctype, CDATA section or processing instruction"""
+        self._flush()
+        if self._in_title:
+            self._title_nodes.append(text)
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+        self._pending.append(data)
+
+    def handle_comment(self, data):
+        self._special(data)
+
+    def handle_decl(self, decl):
+        # BeautifulSoup keeps the doctype as a string node, e.g. "html"
+        if decl.startswith('DOCTYPE '):
+            decl = decl[len('DOCTYPE '):]
+        elif decl == 'DOCTYPE':
+            decl = ''
+        self._special(decl)
+        self._pending.append(decl)
+        self._flush()
+
+    def unknown_decl(self, data):
+        if data.upper().startswith('CDATA['):
+            data = data[len('CDATA['):]
+        self._special(data)
+        self._pending.append(data)
+        self._flush()
+
+    def handle_pi(self, data):
+        self._special(data)
+        self._pending.append(data)
+        self._flush()
+
+    @property
+    def text(self):
+        return ' '.join(' '.join(self.texts).split())
+
+    def page(self):
+        """Return what has been extracted so far, also after an early cutoff"""
+        self._flush()
+        if self._in_title:
+            self.title = self._title_string()
+        return {
+            'title': self.title or 'No Title Found',
+            'text': self.text,
+            'icon_href': self.icon_href
+        }
+
+
+def extract_page(html, removed_tags=REMOVED_TAGS):
+    """Extract the title, visible text and icon link from an HTML document"""
+    parser = VisibleTextParser(removed_tags)
+    parser.feed(html)
+    parser.close()
+    return parser.page()
@@ -0,0 +1,376 @@
+import asyncio
+import codecs
+import functools
+import ipaddress
+import os
+import re
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# Pool sizing and per-host fairness
+FETCH_WORKERS = int(os.getenv('FETCH_WORKERS', 32))
+PER_HOST_LIMIT = int(os.getenv('FETCH_PER_HOST_LIMIT', 4))
+HOST_RATE = float(os.getenv('FETCH_HOST_RATE', 5))  # Requests per second per host
+HOST_BURST = int(os.getenv('FETCH_HOST_BURST', 10))
+
+# Retries for throttled and failing servers
+RETRY_TOTAL = int(os.getenv('FETCH_RETRIES', 3))
+RETRY_BACKOFF = float(os.getenv('FETCH_RETRY_BACKOFF', 0.5))
+MAX_RETRY_AFTER = float(os.getenv('FETCH_MAX_RETRY_AFTER', 30))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Budgets for streamed page downloads
+MAX_PAGE_BYTES = int(os.getenv('FETCH_MAX_PAGE_BYTES', 2 * 1024 * 1024))
+PAGE_DEADLINE = float(os.getenv('FETCH_PAGE_DEADLINE', 15))
+CHUNK_SIZE = 16 * 1024
+HTML_TYPES = ('text/html', 'application/xhtml+xml')
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+CONNECT_TIMEOUT = 5
+MAX_REDIRECTS = 3
+
+
+class UnsupportedContent(Exception):
+    """Raised when a streamed response is not an HTML document"""
+
+
+class BlockedHost(Exception):
+    """Raised when a URL resolves to a private, loopback or otherwise non-public address"""
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After, but never sleeps longer than MAX_RETRY_AFTER"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average with bursts of up to `burst`"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token and return 0, or return how long to wait for one"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class HostLimiter:
+    """At most `limit` concurrent requests to one host, shared by threads and event loops
+
+    Event loops wait on a future rather than a blocked thread, and a freed
+    slot is handed straight to the longest waiter of either kind.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._active = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event.set)
+        event.wait()
+
+    async def acquire_async(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return
+            future = loop.create_future()
+            waiter = functools.partial(loop.call_soon_threadsafe, self._wake, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                handed = waiter not in self._waiters
+                if not handed:
+                    self._waiters.remove(waiter)
+            # A slot handed over before the cancel landed must be passed on;
+            # one still in flight is passed on by _wake
+            if handed and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def _wake(self, future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def release(self):
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._active -= 1
+                    return
+                waiter = self._waiters.popleft()
+            try:
+                waiter()
+                return
+            except RuntimeError:
+                # The waiting event loop has closed; offer the slot to the next waiter
+                continue
+
+
+session = requests.Session()
+session.headers.update(DEFAULT_HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=FETCH_WORKERS,
+    pool_maxsize=FETCH_WORKERS,
+    max_retries=CappedRetry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
+# Streamed page fetches must finish within FETCH_PAGE_DEADLINE, which retries
+# and Retry-After sleeps would overrun, so they get a session without them
+page_session = requests.Session()
+page_session.headers.update(DEFAULT_HEADERS)
+_page_adapter = HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=0)
+page_session.mount('http://', _page_adapter)
+page_session.mount('https://', _page_adapter)
+
+_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='fetch')
+_host_slots = defaultdict(lambda: HostLimiter(PER_HOST_LIMIT))
+_host_buckets = defaultdict(lambda: TokenBucket(HOST_RATE, HOST_BURST))
+_host_slots_lock = threading.Lock()
+# The host whose slot the current fetch thread was started with by run_for_host
+_held = threading.local()
+
+
+def _host_limits(url):
+    host = urlparse(url).netloc.lower()
+    with _host_slots_lock:
+        return host, _host_slots[host], _host_buckets[host]
+
+
+@contextmanager
+def host_slot(url):
+    """Limit the number and rate of requests to a single host"""
+    host, slot, bucket = _host_limits(url)
+    if getattr(_held, 'host', None) == host:
+        # run_for_host already waited for this host in the event loop
+        yield
+        return
+    # Wait for a rate token first, so a throttled host does not hold a slot while waiting
+    if HOST_RATE > 0:
+        bucket.acquire()
+    slot.acquire()
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+@asynccontextmanager
+async def async_host_slot(url):
+    """host_slot for coroutines: waits in the event loop instead of a fetch thread"""
+    host, slot, bucket = _host_limits(url)
+    if HOST_RATE > 0:
+        await bucket.acquire_async()
+    await slot.acquire_async()
+    try:
+        yield host
+    finally:
+        slot.release()
+
+
+def get(url, **kwargs):
+    with host_slot(url):
+        return session.get(url, **kwargs)
+
+
+def head(url, **kwargs):
+    with host_slot(url):
+        return session.head(url, **kwargs)
+
+
+def is_public_url(url):
+    """True when every address the URL's host resolves to is globally routable"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        return False
+    try:
+        infos = socket.getaddrinfo(parsed.hostname, parsed.port or (443 if parsed.scheme == 'https' else 80),
+                                   proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError, ValueError):
+        return False
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split('%')[0])
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if not address.is_global:
+            return False
+    return bool(infos)
+
+
+def get_public(url, max_redirects=MAX_REDIRECTS, **kwargs):
+    """GET a URL on a public host, checking every redirect target as well"""
+    for _ in range(max_redirects + 1):
+        if not is_public_url(url):
+            raise BlockedHost(f"Refusing to fetch non-public address: {url}")
+        response = get(url, allow_redirects=False, **kwargs)
+        if not response.is_redirect:
+            return response
+        url = urljoin(url, response.headers['Location'])
+        response.close()
+    raise requests.TooManyRedirects(f"Exceeded {max_redirects} redirects")
+
+
+@contextmanager
+def stream(url, **kwargs):
+    """Open a streamed GET without retries, holding the host slot until the body is closed"""
+    with host_slot(url):
+        response = page_session.get(url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+
+
+def _response_encoding(response, head):
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset=' in content_type.lower():
+        return response.encoding
+    match = META_CHARSET.search(head)
+    if match:
+        return match.group(1).decode('ascii')
+    return 'utf-8'
+
+
+def page_timeout(deadline=PAGE_DEADLINE):
+    """(connect, read) timeout for a page fetch that has deadline seconds in total
+
+    The two add up to at most deadline, so a slow connect followed by slow
+    headers cannot overrun it either.
+    """
+    connect = min(CONNECT_TIMEOUT, deadline / 2)
+    return (connect, deadline - connect)
+
+
+def _set_read_timeout(response, seconds):
+    # urllib3 applies the read timeout per socket read, so shrink it as the budget runs out
+    sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+    if sock is not None:
+        sock.settimeout(max(seconds, 0.01))
+
+
+def iter_html(response, max_bytes=MAX_PAGE_BYTES, deadline=PAGE_DEADLINE, started=None):
+    """Yield decoded text from a streamed HTML response within a byte and time budget
+
+    Each read returns whatever the socket has (up to CHUNK_SIZE), so a server
+    trickling bytes cannot hold the download past the deadline.
+    """
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type and content_type not in HTML_TYPES:
+        raise UnsupportedContent(f"Unsupported content type: {content_type}")
+
+    started = time.monotonic() if started is None else started
+    received = 0
+    decoder = None
+    while received < max_bytes:
+        remaining = deadline - (time.monotonic() - started)
+        if remaining <= 0:
+            return
+        _set_read_timeout(response, remaining)
+        try:
+            chunk = response.raw.read1(CHUNK_SIZE, decode_content=True)
+        except (ReadTimeoutError, socket.timeout):
+            # The read timeout equals the remaining budget, so it is spent
+            return
+        if not chunk:
+            break
+        chunk = chunk[:max_bytes - received]
+        received += len(chunk)
+        if decoder is None:
+            encoding = _response_encoding(response, chunk)
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            except LookupError:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is not None and received < max_bytes:
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared fetch pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def _holding_host(host, func, *args, **kwargs):
+    _held.host = host
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _held.host = None
+
+
+async def run_for_host(url, func, *args, **kwargs):
+    """Run a blocking fetch of url once its host has a free slot and a rate token
+
+    Both are awaited before the call is submitted, so requests queued for
+    one busy host never occupy fetch threads that other hosts could use.
+    """
+    async with async_host_slot(url) as host:
+        return await run_blocking(_holding_host, host, func, *args, **kwargs)
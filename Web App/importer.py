@@ -0,0 +1,297 @@
+import argparse
+import csv
+import io
+import json
+import os
+import threading
+import time
+from html.parser import HTMLParser
+
+try:
+    import fcntl
+except ImportError:  # Windows has no prefork server, so the in-process guard is enough
+    fcntl = None
+
+# Column names accepted for CSV imports, matched case-insensitively
+CSV_URL_COLUMNS = ('url', 'link', 'href', 'address')
+CSV_TITLE_COLUMNS = ('title', 'name')
+
+
+class BookmarksHTMLParser(HTMLParser):
+    """Collect <A HREF> entries from a Netscape bookmarks file (Chrome, Firefox, Edge export)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.bookmarks = []
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            self._current = {'url': href.strip(), 'title': ''} if href else None
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current['title'] += data
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._current is not None:
+            self._current['title'] = self._current['title'].strip()
+            self.bookmarks.append(self._current)
+            self._current = None
+
+
+def parse_bookmarks_html(text):
+    parser = BookmarksHTMLParser()
+    parser.feed(text)
+    parser.close()
+    return parser.bookmarks
+
+
+def parse_bookmarks_csv(text):
+    reader = csv.DictReader(io.StringIO(text, newline=''))
+    try:
+        columns = {name.strip().lower(): name for name in reader.fieldnames or []}
+        url_column = next((columns[c] for c in CSV_URL_COLUMNS if c in columns), None)
+        if url_column is None:
+            raise ValueError(f"CSV has no URL column (expected one of: {', '.join(CSV_URL_COLUMNS)})")
+        title_column = next((columns[c] for c in CSV_TITLE_COLUMNS if c in columns), None)
+        return [
+            {'url': row[url_column].strip(), 'title': (row.get(title_column) or '').strip() if title_column else ''}
+            for row in reader if row.get(url_column)
+        ]
+    except csv.Error as e:
+        # Malformed files (NUL bytes, oversized fields) are bad input, not server errors
+        raise ValueError(f"Invalid CSV: {str(e)}")
+
+
+def parse_bookmarks(filename, text):
+    """Parse an exported bookmarks file, choosing the format from its name or content"""
+    if filename.lower().endswith('.csv'):
+        return parse_bookmarks_csv(text)
+    if filename.lower().endswith(('.html', '.htm')) or '<dt>' in text[:4096].lower():
+        return parse_bookmarks_html(text)
+    return parse_bookmarks_csv(text)
+
+
+class ImportGuard:
+    """Allow one running import per id, across threads and forked workers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = {}
+
+    def acquire(self, import_id, lock_path):
+        with self._lock:
+            if import_id in self._running:
+                return False
+            handle = None
+            if fcntl:
+                # A second worker process uploading the same file sees the flock
+                handle = open(lock_path, 'a')
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    handle.close()
+                    return False
+            self._running[import_id] = handle
+            return True
+
+    def release(self, import_id):
+        with self._lock:
+            handle = self._running.pop(import_id, None)
+        if handle:
+            handle.close()
+
+
+class BookmarkImporter:
+    """Dedupe, classify and insert bookmarks in chunks
+
+    Each chunk is committed on its own, so a crashed import resumes by
+    running it again: URLs already in content_details are skipped. Pages
+    that cannot be fetched are still saved, uncategorized and under their
+    exported title, and remembered in the optional checkpoint file so a
+    later run can retry them.
+    """
+
+    def __init__(self, pool, predict_many, normalize_tags, get_site_name, chunk_size=100,
+                 checkpoint_path=None, on_progress=None):
+        self.pool = pool
+        self.predict_many = predict_many
+        self.normalize_tags = normalize_tags
+        self.get_site_name = get_site_name
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.on_progress = on_progress
+        self.progress = {
+            'status': 'pending',
+            'total': 0,
+            'existing': 0,
+            'skipped_failed': 0,
+            'processed': 0,
+            'imported': 0,
+            'failed': 0,
+            'started_at': None,
+            'finished_at': None,
+            'error': None
+        }
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {'failed': {}}
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, checkpoint):
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _report(self, **changes):
+        self.progress.update(changes)
+        if self.on_progress:
+            self.on_progress(dict(self.progress))
+
+    def existing_urls(self, cursor, urls):
+        """Return the subset of urls already stored, one IN query per chunk"""
+        found = set()
+        for start in range(0, len(urls), self.chunk_size):
+            chunk = urls[start:start + self.chunk_size]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            cursor.execute(f"SELECT url FROM content_details WHERE url IN ({placeholders})", chunk)
+            found.update(row['url'] for row in cursor.fetchall())
+        return found
+
+    def uncategorized_row(self, url, title):
+        """A row for a bookmark whose page could not be fetched, like a pending /enqueue row"""
+        return {
+            'url': url,
+            'title': title or url,
+            'site_name': self.get_site_name(url),
+            'category': None,
+            'tags': [],
+            'content': None,
+            'favicon_url': None
+        }
+
+    def _write_tags(self, cursor, rows):
+        # Look the ids up rather than assuming consecutive auto-increment values
+        urls = [row['url'] for row in rows]
+        placeholders = ', '.join(['%s'] * len(urls))
+        cursor.execute(f"SELECT id, url FROM content_details WHERE url IN ({placeholders})", urls)
+        ids = {row['url']: row['id'] for row in cursor.fetchall()}
+        tag_rows = [(ids[row['url']], tag) for row in rows for tag in self.normalize_tags(row['tags'])]
+        if tag_rows:
+            cursor.executemany("INSERT IGNORE INTO bookmark_tags (bookmark_id, tag) VALUES (%s, %s)", tag_rows)
+
+    def _insert_chunk(self, cursor, rows):
+        cursor.executemany("""
+            INSERT INTO content_details (url, title, site_name, category, tags, content, favicon_url)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, [
+            (row['url'], row['title'], row['site_name'], row['category'],
+             ','.join(row['tags']), row['content'], row['favicon_url'])
+            for row in rows
+        ])
+        self._write_tags(cursor, rows)
+
+    def _update_chunk(self, cursor, rows):
+        """Fill in uncategorized rows saved by an earlier run"""
+        cursor.executemany("""
+            UPDATE content_details
+            SET title = %s, site_name = %s, category = %s, tags = %s, content = %s, favicon_url = %s
+            WHERE url = %s AND category IS NULL
+        """, [
+            (row['title'], row['site_name'], row['category'], ','.join(row['tags']),
+             row['content'], row['favicon_url'], row['url'])
+            for row in rows
+        ])
+        self._write_tags(cursor, rows)
+
+    def run(self, bookmarks, retry_failed=False):
+        """Import bookmarks and return the final progress report"""
+        self._report(status='running', started_at=time.time())
+        try:
+            checkpoint = self._load_checkpoint()
+            failed = checkpoint['failed']
+            # First exported title wins for duplicate URLs
+            titles = {}
+            for b in bookmarks:
+                if b['url'].startswith(('http://', 'https://')):
+                    titles.setdefault(b['url'], b.get('title') or '')
+            urls = list(titles)
+            with self.pool.connection() as connection, connection.cursor() as cursor:
+                existing = self.existing_urls(cursor, urls)
+            # Unfetchable URLs are already stored uncategorized; only a retry revisits them
+            retry = {url for url in existing if url in failed} if retry_failed else set()
+            pending = [url for url in urls if url not in existing or url in retry]
+            skipped_failed = 0 if retry_failed else sum(1 for url in existing if url in failed)
+            self._report(total=len(urls), existing=len(existing) - len(retry) - skipped_failed,
+                         skipped_failed=skipped_failed)
+
+            for start in range(0, len(pending), self.chunk_size):
+                chunk = pending[start:start + self.chunk_size]
+                predictions = self.predict_many(chunk)
+                inserts = []
+                updates = []
+                fetched = 0
+                for url, prediction in zip(chunk, predictions):
+                    if prediction:
+                        fetched += 1
+                        failed.pop(url, None)
+                        if prediction['title'] in ('', 'No Title Found') and titles[url]:
+                            prediction['title'] = titles[url]
+                        (updates if url in retry else inserts).append(prediction)
+                    else:
+                        failed[url] = 'Failed to extract data from URL'
+                        if url not in retry:
+                            inserts.append(self.uncategorized_row(url, titles[url]))
+                if inserts or updates:
+                    with self.pool.connection() as connection, connection.cursor() as cursor:
+                        if inserts:
+                            self._insert_chunk(cursor, inserts)
+                        if updates:
+                            self._update_chunk(cursor, updates)
+                        connection.commit()
+                self._save_checkpoint(checkpoint)
+                self._report(processed=self.progress['processed'] + len(chunk),
+                             imported=self.progress['imported'] + fetched,
+                             failed=self.progress['failed'] + len(chunk) - fetched)
+
+            self._report(status='done', finished_at=time.time())
+        except Exception as e:
+            self._report(status='error', error=str(e), finished_at=time.time())
+            raise
+        return dict(self.progress)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import exported bookmarks (HTML or CSV) into TAGwise")
+    parser.add_argument('file', help="Chrome bookmarks .html export or a .csv with a url column")
+    parser.add_argument('--chunk-size', type=int, default=100, help="URLs fetched, classified and inserted per batch")
+    parser.add_argument('--checkpoint', help="Progress file (default: <file>.import.json)")
+    parser.add_argument('--retry-failed', action='store_true', help="Re-fetch URLs an earlier run saved uncategorized")
+    args = parser.parse_args()
+
+    import app as webapp
+
+    webapp.create_app()
+    with open(args.file, 'r', encoding='utf-8', errors='replace') as f:
+        bookmarks = parse_bookmarks(args.file, f.read())
+
+    def print_progress(progress):
+        print(f"\r{progress['status']}: {progress['processed']}/{progress['total'] - progress['existing'] - progress['skipped_failed']} processed, "
+              f"{progress['imported']} imported, {progress['failed']} saved uncategorized, {progress['existing']} already saved", end='', flush=True)
+
+    importer = BookmarkImporter(
+        webapp.db_pool, webapp.predict_many, webapp.normalize_tags, webapp.get_site_name,
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint or f"{args.file}.import.json",
+        on_progress=print_progress
+    )
+    importer.run(bookmarks, retry_failed=args.retry_failed)
+    # This process cannot reach the server's query cache; its entries expire after QUERY_CACHE_TTL
+    print(f"\nA running server shows the new bookmarks within {webapp.query_cache.max_age:g}s")
@@ -0,0 +1,146 @@
+import os
+import threading
+
+
+class JobQueue:
+    """Durable queue of bookmark classification jobs stored in MySQL
+
+    Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+    of threads and processes can poll the same table without a broker.
+    """
+
+    def __init__(self, pool, max_attempts=3, retry_delay=30, lease=300):
+        self.pool = pool
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # A running job whose worker died is handed out again after this many seconds
+        self.lease = lease
+
+    def enqueue(self, cursor, bookmark_id, url):
+        """Add a job inside the caller's transaction and return its id"""
+        cursor.execute(
+            "INSERT INTO bookmark_jobs (bookmark_id, url) VALUES (%s, %s)",
+            (bookmark_id, url)
+        )
+        return cursor.lastrowid
+
+    def claim(self):
+        """Mark the oldest available job as running and return it, or None"""
+        with self.pool.connection() as connection, connection.cursor() as cursor:
+            # A job whose worker died on its last attempt is not handed out again
+            cursor.execute("""
+                UPDATE bookmark_jobs
+                SET status = 'failed', error = 'Worker lease expired on the final attempt'
+                WHERE status = 'running' AND attempts >= %s
+                  AND claimed_at < NOW() - INTERVAL %s SECOND
+            """, (self.max_attempts, self.lease))
+            cursor.execute("""
+                SELECT id, bookmark_id, url, attempts FROM bookmark_jobs
+                WHERE (status = 'pending' AND available_at <= NOW())
+                   OR (status = 'running' AND attempts < %s
+                       AND claimed_at < NOW() - INTERVAL %s SECOND)
+                ORDER BY id
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            """, (self.max_attempts, self.lease))
+            job = cursor.fetchone()
+            if not job:
+                connection.commit()
+                return None
+            cursor.execute("""
+                UPDATE bookmark_jobs
+                SET status = 'running', attempts = attempts + 1, claimed_at = NOW()
+                WHERE id = %s
+            """, (job['id'],))
+            connection.commit()
+        job['attempts'] += 1
+        return job
+
+    def complete(self, cursor, job_id):
+        """Mark a job done inside the caller's transaction"""
+        cursor.execute(
+            "UPDATE bookmark_jobs SET status = 'done', error = NULL WHERE id = %s",
+            (job_id,)
+        )
+
+    def fail(self, job, error):
+        """Retry a job later, or give up after max_attempts"""
+        with self.pool.connection() as connection, connection.cursor() as cursor:
+            if job['attempts'] < self.max_attempts:
+                cursor.execute("""
+                    UPDATE bookmark_jobs
+                    SET status = 'pending', error = %s,
+                        available_at = NOW() + INTERVAL %s SECOND
+                    WHERE id = %s
+                """, (error[:1000], self.retry_delay * job['attempts'], job['id']))
+            else:
+                cursor.execute(
+                    "UPDATE bookmark_jobs SET status = 'failed', error = %s WHERE id = %s",
+                    (error[:1000], job['id'])
+                )
+            connection.commit()
+
+    def get(self, job_id):
+        with self.pool.connection() as connection, connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT j.id, j.bookmark_id, j.url, j.status, j.attempts, j.error,
+                       j.created_at, j.updated_at, c.title, c.category, c.tags
+                FROM bookmark_jobs j
+                LEFT JOIN content_details c ON c.id = j.bookmark_id
+                WHERE j.id = %s
+            """, (job_id,))
+            return cursor.fetchone()
+
+
+class JobWorkers:
+    """Background threads that claim jobs and pass them to a handler"""
+
+    def __init__(self, queue, handler, threads=2, poll_interval=5, logger=None):
+        self.queue = queue
+        self.handler = handler
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.logger = logger
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def ensure_started(self):
+        """Start the worker threads once per process; threads do not survive a fork"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._wakeup = threading.Event()
+            for i in range(self.threads):
+                threading.Thread(target=self._run, name=f'job-worker-{i}', daemon=True).start()
+
+    def notify(self):
+        """Wake idle workers after a job has been enqueued"""
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            try:
+                job = self.queue.claim()
+            except Exception as e:
+                self._log(f"Job claim error: {str(e)}")
+                job = None
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            try:
+                self.handler(job)
+            except Exception as e:
+                self._log(f"Job {job['id']} error: {str(e)}")
+                try:
+                    self.queue.fail(job, str(e))
+                except Exception as e:
+                    self._log(f"Job {job['id']} could not be marked failed: {str(e)}")
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.error(message)
@@ -0,0 +1,143 @@
+import argparse
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+
+# Files every model version directory must contain
+MODEL_FILES = ('tfidf_vectorizer.joblib', 'label_encoder.joblib', 'xgboost_model.joblib')
+ACTIVE_FILE = 'ACTIVE'
+LEGACY_VERSION = 'legacy'
+
+
+class ModelRegistry:
+    """Versioned model directories with an atomically swapped active predictor
+
+    Each version lives in root/<version>/ and root/ACTIVE names the one to
+    serve. When no version is active the artifacts in legacy_dir are used.
+    """
+
+    def __init__(self, root, loader, legacy_dir=None, warmup=None):
+        self.root = root
+        self.loader = loader
+        self.legacy_dir = legacy_dir
+        self.warmup = warmup
+        self._active = None
+        self._info = {}
+        self._lock = threading.Lock()
+        # Serializes loads so two reloads never build models concurrently
+        self._load_lock = threading.RLock()
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if all(os.path.isfile(os.path.join(self.root, name, f)) for f in MODEL_FILES)
+        )
+
+    def active_version(self):
+        """Return the version named in the ACTIVE file, or None"""
+        try:
+            with open(os.path.join(self.root, ACTIVE_FILE), 'r') as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+
+    def _resolve(self, version):
+        if version is None:
+            version = self.active_version()
+        if version is None:
+            if self.legacy_dir is None:
+                raise LookupError("No active model version and no legacy model directory")
+            return LEGACY_VERSION, self.legacy_dir
+        if version not in self.versions():
+            raise LookupError(f"Unknown model version: {version}")
+        return version, os.path.join(self.root, version)
+
+    def load(self, version=None):
+        """Load and warm up a version, then swap it in; in-flight requests keep the old one"""
+        with self._load_lock:
+            version, path = self._resolve(version)
+            started = time.monotonic()
+            predictor = self.loader(path)
+            predictor.version = version
+            if self.warmup:
+                self.warmup(predictor)
+            info = {
+                'version': version,
+                'path': path,
+                'loaded_at': datetime.now().isoformat(timespec='seconds'),
+                'load_seconds': round(time.monotonic() - started, 3)
+            }
+            with self._lock:
+                self._active = predictor
+                self._info = info
+            return predictor
+
+    def activate(self, version):
+        """Load a version and record it as active so restarts keep serving it"""
+        predictor = self.load(version)
+        set_active(self.root, predictor.version)
+        return predictor
+
+    def select(self, version):
+        """Record a version as active without loading it in this process"""
+        self._resolve(version)
+        set_active(self.root, version)
+
+    def current(self):
+        """Return the active predictor, loading it on first use"""
+        predictor = self._active
+        if predictor is None:
+            with self._load_lock:
+                predictor = self._active or self.load()
+        return predictor
+
+    def status(self):
+        with self._lock:
+            info = dict(self._info)
+        info['available'] = self.versions()
+        info['active_file'] = self.active_version()
+        return info
+
+
+def set_active(root, version):
+    tmp_path = os.path.join(root, f"{ACTIVE_FILE}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(version)
+    os.replace(tmp_path, os.path.join(root, ACTIVE_FILE))
+
+
+def publish(root, source_dir, version=None, model_file=MODEL_FILES[2]):
+    """Copy trained artifacts into a new version directory and return its name"""
+    version = version or datetime.now().strftime('%Y%m%d-%H%M%S')
+    target = os.path.join(root, version)
+    if os.path.exists(target):
+        raise FileExistsError(f"Model version already exists: {version}")
+    # Copy into a temp directory first so a half-copied version is never listed
+    tmp_target = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(tmp_target)
+    for name, source_name in zip(MODEL_FILES, (MODEL_FILES[0], MODEL_FILES[1], model_file)):
+        shutil.copy2(os.path.join(source_dir, source_name), os.path.join(tmp_target, name))
+    os.replace(tmp_target, target)
+    return version
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish trained model artifacts as a registry version")
+    parser.add_argument('source_dir', help="Directory containing the trained .joblib files")
+    parser.add_argument('--root', default=os.getenv('MODEL_REGISTRY_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')))
+    parser.add_argument('--version', help="Version name (default: timestamp)")
+    parser.add_argument('--model-file', default=MODEL_FILES[2], help="Classifier file to publish, e.g. logistic_regression.joblib")
+    parser.add_argument('--activate', action='store_true', help="Mark the new version active")
+    args = parser.parse_args()
+
+    os.makedirs(args.root, exist_ok=True)
+    version = publish(args.root, args.source_dir, args.version, args.model_file)
+    if args.activate:
+        set_active(args.root, version)
+    print(f"Published {version} to {args.root}" + (" (active)" if args.activate else ""))
+    print("POST /admin/model to load it into a running server")
@@ -0,0 +1,97 @@
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+
+
+class LocalGenerations:
+    """Per-table write counters for a single process"""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, table):
+        return self._counters.get(table, 0)
+
+    def bump(self, table):
+        with self._lock:
+            self._counters[table] = self._counters.get(table, 0) + 1
+
+
+class SharedGenerations:
+    """Per-table write counters in shared memory, visible to every forked worker"""
+
+    # Must be created before forking; tables not listed here are never invalidated
+    def __init__(self, tables):
+        self._counters = {table: multiprocessing.Value('L', 0) for table in tables}
+
+    def get(self, table):
+        counter = self._counters.get(table)
+        return counter.value if counter is not None else 0
+
+    def bump(self, table):
+        counter = self._counters[table]
+        with counter.get_lock():
+            counter.value += 1
+
+
+class QueryCache:
+    """Read-through cache of query results, invalidated when a source table changes"""
+
+    # Each entry remembers the generation of every table it was read from, so
+    # bumping one table's generation only drops the entries that depend on it.
+    # max_age bounds how long an entry survives writes this process never sees
+    # (the import CLI, manual SQL), since those cannot bump the generations.
+    def __init__(self, max_entries=256, generations=None, max_age=None):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.generations = generations or LocalGenerations()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def _snapshot(self, tables):
+        return tuple(self.generations.get(table) for table in tables)
+
+    def get_or_load(self, route, params, tables, loader):
+        key = (route, params)
+        # Snapshot before loading so a concurrent write leaves this entry stale
+        snapshot = self._snapshot(tables)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == snapshot and (self.max_age is None or now - entry[1] < self.max_age):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            if entry:
+                self.stale += 1
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (snapshot, now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *tables):
+        for table in tables:
+            self.generations.bump(table)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'max_age': self.max_age,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,150 @@
+import argparse
+import gc
+import os
+import signal
+import sys
+import threading
+import time
+
+from werkzeug.serving import make_server
+
+import app as webapp
+from query_cache import SharedGenerations
+
+
+class PreforkServer:
+    """Load the model once, then fork workers that share it copy-on-write
+
+    Every worker serves the same listening socket. SIGHUP reloads the active
+    model in the master and replaces the workers; SIGTERM/SIGINT stop them.
+    """
+
+    def __init__(self, application, host, port, workers, graceful_timeout=30):
+        self.application = application
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.server = make_server(host, port, application, threaded=True)
+        # Let a stopping worker finish its in-flight requests
+        self.server.daemon_threads = False
+        self.server.block_on_close = True
+        self.children = set()
+        self._reload = False
+        self._stop = False
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self._run_worker()
+            except Exception as e:
+                print(f"Worker {os.getpid()} error: {str(e)}", file=sys.stderr)
+                code = 1
+            finally:
+                os._exit(code)
+        self.children.add(pid)
+
+    def _run_worker(self):
+        gc.enable()
+        stopping = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *args: stopping.set())
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        # Pick up queued jobs without waiting for the first request
+        webapp.job_workers.ensure_started()
+        while not stopping.wait(1):
+            if os.getppid() == 1:
+                break
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _stop_children(self, pids):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.graceful_timeout
+        remaining = set(pids)
+        while remaining and time.monotonic() < deadline:
+            for pid in list(remaining):
+                try:
+                    if os.waitpid(pid, os.WNOHANG)[0]:
+                        remaining.discard(pid)
+                except ChildProcessError:
+                    remaining.discard(pid)
+            time.sleep(0.1)
+        for pid in remaining:
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+
+    def _freeze(self):
+        # Keep the cyclic GC from touching (and so copying) the master's objects
+        gc.collect()
+        gc.freeze()
+
+    def _reload_workers(self):
+        try:
+            webapp.model_registry.load()
+        except Exception as e:
+            print(f"Model reload failed, keeping current workers: {str(e)}", file=sys.stderr)
+            return
+        self._freeze()
+        old = set(self.children)
+        self.children.clear()
+        for _ in range(self.workers):
+            self._spawn()
+        self._stop_children(old)
+        print(f"Reloaded model {webapp.model_registry.status()['version']}")
+
+    def _handle_signal(self, signum, frame):
+        if signum == signal.SIGHUP:
+            self._reload = True
+        else:
+            self._stop = True
+
+    def run(self):
+        signal.signal(signal.SIGHUP, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        self._freeze()
+        for _ in range(self.workers):
+            self._spawn()
+        print(f"Serving on {self.server.host}:{self.server.port} with {self.workers} workers (master {os.getpid()})")
+
+        while not self._stop:
+            if self._reload:
+                self._reload = False
+                self._reload_workers()
+            # Replace workers that exited unexpectedly
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if pid and pid in self.children:
+                self.children.discard(pid)
+                print(f"Worker {pid} exited with status {status}, restarting", file=sys.stderr)
+                self._spawn()
+            time.sleep(0.5)
+
+        self._stop_children(set(self.children))
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the TAGwise API with pre-forked workers")
+    parser.add_argument('--host', default=os.getenv('HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('WEB_WORKERS', os.cpu_count() or 1)))
+    args = parser.parse_args()
+
+    application = webapp.create_app()
+    application.config['PREFORK_MASTER_PID'] = os.getpid()
+    # Workers keep private caches but must agree on which query results are stale
+    webapp.query_cache.generations = SharedGenerations(webapp.QUERY_CACHE_TABLES)
+    PreforkServer(application, args.host, args.port, args.workers).run()
@@ -0,0 +1,50 @@
+import csv
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..'))
+
+import text_normalize
+from text_normalize import check_parity
+
+pytest.importorskip('pandas')
+
+RESEARCH_CSV = os.path.join(TESTS_DIR, '..', '..', 'Research', 'video_details.csv')
+
+SAMPLES = [
+    "Check THIS out 😂🔥 https://example.com/watch?v=1 and www.test.org!",
+    "Café déjà vu — naïve résumé",
+    "mojibake â€™ and � replacement\ttabs\r\nnewlines\n\nhere",
+    "  leading/trailing   spaces  ",
+    "Kelvin K and dotted İstanbul",
+    "",
+    None,
+    "under_scores, numbers 42 and ½ fractions",
+    "line\u2028separator, ﬁ ligature and ＦＵＬＬＷＩＤＴＨ text"
+]
+
+
+def research_texts(limit=200):
+    with open(RESEARCH_CSV, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))[:limit]
+    return [row['Title'] for row in rows] + [row['Description'] for row in rows]
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_samples_normalize_identically(processes):
+    assert check_parity(SAMPLES, processes) == []
+
+
+def test_research_titles_normalize_identically():
+    texts = research_texts()
+    assert texts
+    assert check_parity(texts, 2) == []
+
+
+def test_reports_mismatch(monkeypatch):
+    monkeypatch.setattr(text_normalize, 'clean_text', lambda text: text.upper())
+    mismatches = check_parity(["Mixed Case"])
+    assert [text for text, _, _ in mismatches] == ["Mixed Case"]
@@ -0,0 +1,128 @@
+import argparse
+import math
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+EMOJI_PATTERN = re.compile("["
+                           u"\U0001F600-\U0001F64F"  # emoticons
+                           u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                           u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                           u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+                           u"\U00002500-\U00002BEF"  # chinese characters
+                           u"\U00002702-\U000027B0"
+                           u"\U000024C2-\U0001F251"
+                           "]+", flags=re.UNICODE)
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+SPECIAL_PATTERN = re.compile(r'[^\w\s]')
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7F]+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# With re.ASCII every non-ASCII character is "special" too, so batch mode
+# strips punctuation and non-ASCII runs in a single pass
+ASCII_SPECIAL_PATTERN = re.compile(r'[^\w\s]+', flags=re.ASCII)
+
+BATCH_CHUNK_SIZE = 10000
+
+
+def remove_emojis(text):
+    return EMOJI_PATTERN.sub('', text)
+
+
+def remove_links(text):
+    return URL_PATTERN.sub('', text)
+
+
+def clean_text(text):
+    """Strip emojis, links and punctuation, collapse whitespace and lowercase"""
+    if not isinstance(text, str) or not text:
+        return ''
+    text = remove_emojis(text)
+    text = remove_links(text)
+    text = SPECIAL_PATTERN.sub(' ', text)  # Remove special characters
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()  # Remove extra whitespace
+    return text.lower()
+
+
+def clean_garbled_text(text):
+    """Replace non-ASCII runs (mojibake, replacement characters) with spaces"""
+    text = NON_ASCII_PATTERN.sub(' ', text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def normalize_text(text):
+    """The exact text the classifier sees, in training and in serving"""
+    return clean_garbled_text(clean_text(text))
+
+
+def normalize_batch(texts):
+    """normalize_text for a list of texts, running each pattern once per batch
+
+    Texts are joined with newlines (newlines inside a text become spaces,
+    which every step treats identically) and split apart before the final
+    whitespace collapse.
+    """
+    texts = ['' if not isinstance(text, str) else text.replace('\n', ' ') for text in texts]
+    if not texts:
+        return []
+    joined = '\n'.join(texts)
+    joined = EMOJI_PATTERN.sub('', joined)
+    joined = URL_PATTERN.sub('', joined)
+    joined = ASCII_SPECIAL_PATTERN.sub(' ', joined.lower())
+    return [' '.join(line.split()) for line in joined.split('\n')]
+
+
+def normalize_series(series, processes=None, chunk_size=BATCH_CHUNK_SIZE):
+    """Normalize a pandas Series, optionally spreading chunks over worker processes"""
+    import pandas as pd
+
+    texts = series.tolist()
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    if processes and processes > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as executor:
+            results = list(executor.map(normalize_batch, chunks))
+    else:
+        results = [normalize_batch(chunk) for chunk in chunks]
+    return pd.Series([text for chunk in results for text in chunk], index=series.index, dtype=object)
+
+
+def check_parity(texts, processes=None):
+    """Return the texts where serving, scalar training and batch training disagree"""
+    import pandas as pd
+
+    # Serving normalizes text that has already been through clean_text
+    serving = [normalize_text(clean_text(text)) for text in texts]
+    scalar = [normalize_text(text) for text in texts]
+    batch = normalize_series(pd.Series(texts, dtype=object), processes=processes,
+                             chunk_size=max(1, math.ceil(len(texts) / max(1, processes or 1)))).tolist()
+    return [(text, a, c) for text, a, b, c in zip(texts, serving, scalar, batch) if not a == b == c]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that training and serving normalize text identically")
+    parser.add_argument('--dataset', help="Parquet dataset from Model Training/build_dataset.py (default: built-in samples)")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    texts = [
+        "Check THIS out 😂🔥 https://example.com/watch?v=1 and www.test.org!",
+        "Café déjà vu — naïve résumé",
+        "mojibake â€™ and � replacement\ttabs\r\nnewlines\n\nhere",
+        "  leading/trailing   spaces  ",
+        "Kelvin K and dotted İstanbul",
+        "",
+        None,
+        "under_scores, numbers 42 and ½ fractions"
+    ]
+    if args.dataset:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(args.dataset, columns=['title', 'description'], memory_map=True)
+        texts = table.column('title').to_pylist() + table.column('description').to_pylist()
+
+    mismatches = check_parity(texts, args.processes)
+    for text, serving, training in mismatches[:10]:
+        print(f"MISMATCH {text!r}\n  serving:  {serving!r}\n  training: {training!r}")
+    print(f"{len(texts) - len(mismatches):,}/{len(texts):,} texts normalize identically")
+    sys.exit(1 if mismatches else 0)